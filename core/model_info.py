@@ -1,18 +1,46 @@
 # core/model_info.py
 
-import humanize
+import json
+import logging
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+
+# Download sizes fetched from the Hugging Face hub, and how long they stay fresh
+_SIZES_CACHE = Path.home() / '.cache' / 'subtitle-creator' / 'models.json'
+_SIZES_MAX_AGE = 24 * 60 * 60
+# Seconds to wait on each hub request; the refresh runs on the shared pool,
+# which the window drains when it closes
+_SIZES_TIMEOUT = 10
+
+def _format_size(num_bytes: int) -> str:
+    """Format a byte count in binary units (MiB/GiB)."""
+    if num_bytes >= 2**30:
+        return f"{num_bytes / 2**30:.1f} GiB"
+    return f"{num_bytes / 2**20:.1f} MiB"
 
 class ModelInfo:
     """Information about available Whisper models."""
 
     SIZES = {
-        'tiny': {'size': 75_000_000, 'desc': 'Fastest, least accurate'},
-        'base': {'size': 150_000_000, 'desc': 'Fast, decent accuracy'},
-        'small': {'size': 500_000_000, 'desc': 'Balanced speed/accuracy'},
-        'medium': {'size': 1_500_000_000, 'desc': 'Slower, more accurate'},
-        'large': {'size': 2_900_000_000, 'desc': 'Slowest, most accurate'}
+        'tiny': {'size': 75_000_000, 'desc': 'Fastest, least accurate',
+                 'repo': 'Systran/faster-whisper-tiny'},
+        'base': {'size': 150_000_000, 'desc': 'Fast, decent accuracy',
+                 'repo': 'Systran/faster-whisper-base'},
+        'small': {'size': 500_000_000, 'desc': 'Balanced speed/accuracy',
+                  'repo': 'Systran/faster-whisper-small'},
+        'medium': {'size': 1_500_000_000, 'desc': 'Slower, more accurate',
+                   'repo': 'Systran/faster-whisper-medium'},
+        'large': {'size': 3_100_000_000, 'desc': 'Slowest, most accurate',
+                  'repo': 'Systran/faster-whisper-large-v3'}
     }
 
+    # Pretty sizes are fixed, so format them once at import
+    for _spec in SIZES.values():
+        _spec['size_str'] = _format_size(_spec['size'])
+    del _spec
+
     LANGUAGES = {
         'auto': 'Auto Detect',
         'en': 'English',
@@ -29,9 +57,75 @@ class ModelInfo:
     }
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_model_info(model_name: str) -> str:
         """Returns formatted information about the model."""
-        info = ModelInfo.SIZES.get(model_name, {})
-        size_str = humanize.naturalsize(info.get('size', 0), binary=True)
+        return ModelInfo.format_info(model_name, ModelInfo.SIZES.get(model_name, {}))
+
+    @staticmethod
+    def format_info(model_name: str, info: dict) -> str:
+        """Format a model's entry from its already looked-up SIZES record."""
+        size_str = info.get('size_str', _format_size(0))
         desc = info.get('desc', '')
         return f"{model_name} ({size_str}) - {desc}"
+
+    @staticmethod
+    def _apply_sizes(sizes: dict) -> None:
+        """Overwrite the built-in sizes with measured ones."""
+        for model_name, size in sizes.items():
+            if model_name in ModelInfo.SIZES:
+                ModelInfo.SIZES[model_name]['size'] = size
+                ModelInfo.SIZES[model_name]['size_str'] = _format_size(size)
+        ModelInfo.get_model_info.cache_clear()
+
+    @staticmethod
+    def load_cached_sizes() -> None:
+        """Apply sizes from the last refresh, however old; never blocks on the network."""
+        try:
+            ModelInfo._apply_sizes(json.loads(_SIZES_CACHE.read_bytes()))
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def refresh_sizes() -> dict:
+        """Re-measure download sizes on the hub once they are over a day old.
+
+        Returns the new sizes if they changed, or an empty dict; the caller
+        applies them with _apply_sizes, so SIZES is only written on its thread.
+        """
+        try:
+            if time.time() - _SIZES_CACHE.stat().st_mtime < _SIZES_MAX_AGE:
+                return {}
+        except OSError:
+            pass
+
+        try:
+            from huggingface_hub import HfApi
+
+            api = HfApi()
+            sizes = {}
+            # The first failure ends the refresh rather than waiting out a
+            # timeout for every remaining model
+            for model_name, info in list(ModelInfo.SIZES.items()):
+                repo = api.model_info(info['repo'], files_metadata=True, timeout=_SIZES_TIMEOUT)
+                sizes[model_name] = sum(f.size or 0 for f in repo.siblings)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Could not refresh model sizes: {str(e)}")
+            return {}
+
+        # The fresh sizes are used either way; failing to cache them only
+        # means the next start measures again
+        try:
+            _SIZES_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _SIZES_CACHE.with_suffix('.tmp')
+            tmp_path.write_text(json.dumps(sizes))
+            os.replace(tmp_path, _SIZES_CACHE)
+        except OSError:
+            pass
+
+        if any(ModelInfo.SIZES[m]['size'] != size for m, size in sizes.items()):
+            return sizes
+        return {}
+
+
+ModelInfo.load_cached_sizes()
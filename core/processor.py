@@ -1,182 +1,626 @@
 # core/processor.py
 
-import whisper
+import numpy as np
 import subprocess
 import os
 from pathlib import Path
 import shutil
 import json
 import logging
-from datetime import timedelta
-from typing import Dict
+import re
+import threading
+from dataclasses import asdict
+from functools import cached_property, lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict
 
 from core.model_info import ModelInfo
-from utils.translator import SubtitleTranslator
+from core.settings import AppSettings
+
+# faster-whisper pulls in CTranslate2, PyAV and onnxruntime, and the
+# translator pulls in deep_translator and its HTTP stack; both are imported
+# where they are used so the window can show first
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+    from utils.translator import SubtitleTranslator
+
+# Leading/trailing blanks on any SRT line, and runs of blanks within one
+_LINE_BLANKS = re.compile(r'^[ \t]+|[ \t]+$', re.MULTILINE)
+_BLANK_RUNS = re.compile(r'[ \t\f\v]+')
+
+# Color name -> ASS colour in BGR order
+_COLOR_MAP = {
+    'white': '&HFFFFFF&',    # BGR: 255,255,255
+    'yellow': '&H00FFFF&',   # BGR: 0,255,255
+    'black': '&H000000&',    # BGR: 0,0,0
+    'green': '&H00FF00&',    # BGR: 0,255,0
+    'cyan': '&HFFFF00&',     # BGR: 255,255,0
+    'gray': '&H808080&',     # BGR: 128,128,128
+    'none': ''               # Nessun colore
+}
+
+# Keep ffmpeg/ffprobe from flashing a console window on Windows
+_CREATE_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# ffmpeg/ffprobe are resolved on PATH once instead of on every spawn
+_FFMPEG = shutil.which('ffmpeg') or 'ffmpeg'
+_FFPROBE = shutil.which('ffprobe') or 'ffprobe'
+
+# Used to keep the burn encode off CPU 0, which the GUI thread then has
+# to itself (Linux only)
+_TASKSET = shutil.which('taskset')
+
+# Whisper works on 16 kHz mono audio
+_SAMPLE_RATE = 16000
+
+# Long audio is split on VAD silences into chunks of about this length
+_CHUNK_SECONDS = 60
+
+# Videos burned concurrently by process_batch
+_BATCH_WORKERS = min(4, os.cpu_count() or 1)
+
+# CTranslate2 threads per transcription worker on CPU
+_CPU_THREADS_PER_WORKER = 4
+
+# Hardware video encoders, in order of preference for "auto"
+_HW_ENCODERS = ('h264_nvenc', 'hevc_nvenc', 'h264_qsv', 'h264_amf', 'h264_vaapi',
+                'h264_videotoolbox')
+
+# Render node VAAPI encodes go through on Linux
+_VAAPI_DEVICE = '/dev/dri/renderD128'
+
+# ffmpeg stderr lines meaning the encoder or its device never started, the
+# only failures worth retrying with libx264
+_ENCODER_INIT_ERRORS = ('Error while opening encoder', 'No capable devices found',
+                        'Cannot load', 'Device creation failed', 'Failed to initialise VAAPI')
+
+# x264 preset -> NVENC preset (p1 fastest, p7 slowest)
+_NVENC_PRESETS = {
+    'ultrafast': 'p1',
+    'superfast': 'p2',
+    'veryfast': 'p3',
+    'faster': 'p3',
+    'fast': 'p4',
+    'medium': 'p4',
+    'slow': 'p6'
+}
+
+# Image-based subtitle codecs that cannot be converted to SRT text
+_BITMAP_SUBTITLE_CODECS = frozenset({'hdmv_pgs_subtitle', 'dvd_subtitle', 'dvb_subtitle', 'xsub'})
+
+# Text subtitle codec each container can hold; anything else is MP4-style
+_SOFT_SUBTITLE_CODECS = {'.mkv': 'srt', '.webm': 'webvtt'}
+
+# x264 preset -> AMF quality mode
+_AMF_QUALITY = {
+    'ultrafast': 'speed',
+    'superfast': 'speed',
+    'veryfast': 'speed',
+    'faster': 'speed',
+    'fast': 'balanced',
+    'medium': 'balanced',
+    'slow': 'quality'
+}
+
+# Subtitle position -> ASS numpad alignment
+_ALIGNMENT_MAP = {
+    "top center": "8",     # Top center
+    "bottom": "2"          # Bottom center (default)
+}
+
+def _configure_logging():
+    """Set up the application log once, unless the host app already did."""
+    if logging.getLogger().handlers:
+        return
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('subtitle_app.log'),
+            logging.StreamHandler()
+        ]
+    )
+
+
+_configure_logging()
+
 
 class SubtitleProcessor:
     """Manages the creation and processing of subtitles."""
 
     def __init__(self):
-        # Conf logging
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('subtitle_app.log'),
-                logging.StreamHandler()
-            ]
-        )
         self.logger = logging.getLogger(__name__)
 
         # Cache directory
         self.cache_dir = Path.home() / '.cache' / 'whisper'
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize the translator
-        self.translator = SubtitleTranslator()
+        # Names of downloaded models, filled lazily by _scan_cache
+        self._downloaded_models = None
+        self._downloaded_models_mtime = None
 
         # Current model
         self.current_model = None
+        self.current_model_name = None
+        self._transcribe_workers = 1
+
+        # Models load on a single background thread so that loading can
+        # overlap with other work
+        self._model_executor = ThreadPoolExecutor(max_workers=1)
+        self._model_future = None
+        self._model_future_key = None
+
+        # ffprobe results, keyed by video path
+        self._probe_cache = {}
+
+        # Extracted subtitle tracks, keyed by (path, mtime)
+        self._subtitle_cache = {}
+
+        # Video encoders ffmpeg offers; the first is the "auto" choice
+        self.available_video_encoders = self._detect_video_encoders()
 
         # Processing state
         self.processing = False
 
+        # Bytes last read from or written to settings.json
+        self._saved_settings = None
+
+    @cached_property
+    def translator(self) -> "SubtitleTranslator":
+        """Translator backend, built on first use."""
+        from utils.translator import SubtitleTranslator
+        return SubtitleTranslator()
+
     def format_timestamp(self, seconds: float) -> str:
         """Converts seconds to SRT timestamp format."""
-        td = timedelta(seconds=seconds)
-        hours = td.seconds//3600
-        minutes = (td.seconds//60)%60
-        seconds = td.seconds%60
-        milliseconds = td.microseconds//1000
-        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
-
-    def extract_audio(self, video_path: str) -> str:
-        """Extract audio from video."""
+        milliseconds = round(seconds * 1000)
+        hours, milliseconds = divmod(milliseconds, 3_600_000)
+        minutes, milliseconds = divmod(milliseconds, 60_000)
+        secs, milliseconds = divmod(milliseconds, 1000)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
+
+    def _detect_video_encoders(self) -> list:
+        """List the hardware encoders ffmpeg reports, best first, then libx264."""
+        try:
+            result = subprocess.run(
+                [_FFMPEG, '-hide_banner', '-encoders'],
+                creationflags=_CREATE_NO_WINDOW,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            available = {line.split()[1] for line in result.stdout.splitlines()
+                         if len(line.split()) > 1}
+        except Exception as e:
+            self.logger.warning(f"Could not list ffmpeg encoders: {str(e)}")
+            return ['libx264']
+
+        # VAAPI is compiled into most Linux builds; only offer it with a GPU
+        if not os.path.exists(_VAAPI_DEVICE):
+            available.discard('h264_vaapi')
+
+        encoders = [encoder for encoder in _HW_ENCODERS if encoder in available]
+        if encoders:
+            self.logger.info(f"Hardware video encoders available: {', '.join(encoders)}")
+        return encoders + ['libx264']
+
+    @staticmethod
+    def _video_codec_args(encoder: str, video_quality: str, video_preset: str,
+                          tune: str = "none") -> list:
+        """Translate the x264 CRF/preset settings to the given encoder's options."""
+        # yuv420p keeps the output playable on phones and browsers
+        if encoder in ('h264_nvenc', 'hevc_nvenc'):
+            args = ['-c:v', encoder, '-preset', _NVENC_PRESETS.get(video_preset, 'p4'),
+                    '-rc', 'vbr', '-cq', video_quality, '-b:v', '0', '-pix_fmt', 'yuv420p']
+            if encoder == 'hevc_nvenc':
+                args += ['-tag:v', 'hvc1']  # Lets Apple players open HEVC in MP4
+            return args
+        if encoder == 'h264_qsv':
+            # QSV wants nv12 input, which ffmpeg converts to on its own
+            preset = video_preset if video_preset not in ('ultrafast', 'superfast') else 'veryfast'
+            return ['-c:v', encoder, '-preset', preset, '-global_quality', video_quality]
+        if encoder == 'h264_amf':
+            # Constant QP is the closest AMF gets to CRF
+            return ['-c:v', encoder, '-quality', _AMF_QUALITY.get(video_preset, 'balanced'),
+                    '-rc', 'cqp', '-qp_i', video_quality, '-qp_p', video_quality,
+                    '-pix_fmt', 'yuv420p']
+        if encoder == 'h264_vaapi':
+            return ['-c:v', encoder, '-qp', video_quality]
+        if encoder == 'h264_videotoolbox':
+            # -q:v runs 1-100 with higher meaning better, unlike CRF
+            quality = max(1, min(100, 100 - 2 * int(video_quality)))
+            return ['-c:v', encoder, '-q:v', str(quality), '-pix_fmt', 'yuv420p']
+        args = ['-c:v', 'libx264', '-preset', video_preset, '-crf', video_quality,
+                '-pix_fmt', 'yuv420p']
+        if tune != "none":
+            args += ['-tune', tune]  # x264 only; hardware encoders have no equivalent
+        return args
+
+    @staticmethod
+    def _pump_progress(stream, duration_us: int, progress_callback=None):
+        """Turn ffmpeg's -progress key=value stream into 30-100% callbacks."""
+        current_us = 0
+        speed = ''
+        last = None
+        for line in stream:
+            key, _, value = line.strip().partition('=')
+            if key == 'out_time_us':
+                try:
+                    current_us = int(value)
+                except ValueError:  # "N/A" before the first frame is written
+                    pass
+            elif key == 'speed':
+                speed = value if value != 'N/A' else ''
+            elif key == 'progress' and progress_callback and duration_us > 0:
+                # "progress" closes each block, so every field is current
+                percent = 30 + int(70 * min(current_us / duration_us, 1.0))
+                # Only report actual movement; each block repeats the last
+                # time while ffmpeg is still buffering
+                if percent != last:
+                    status = f"Burning subtitles... ({speed})" if speed else "Burning subtitles..."
+                    progress_callback(status, percent)
+                    last = percent
+
+    def _run_ffmpeg(self, cmd: list, duration_us: int, progress_callback=None):
+        """Run an ffmpeg command that reports on -progress pipe:1.
+
+        Returns (returncode, stderr).
+        """
+        process = subprocess.Popen(
+            cmd,
+            creationflags=_CREATE_NO_WINDOW,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True
+        )
+
+        # Progress arrives on stdout; stderr only carries log output
+        # and is drained here so neither pipe can fill up
+        pump = threading.Thread(
+            target=self._pump_progress,
+            args=(process.stdout, duration_us, progress_callback),
+            daemon=True
+        )
+        pump.start()
+        stderr = process.stderr.read()
+        process.wait()
+        pump.join()
+        return process.returncode, stderr
+
+    def _probe(self, video_path: str) -> Dict:
+        """Run ffprobe once per video and cache its stream/format metadata.
+
+        The cache is keyed on the file's mtime and size as well, so a video
+        that is overwritten in place is probed again.
+        """
+        st = os.stat(video_path)
+        key = (video_path, st.st_mtime_ns, st.st_size)
+        if key in self._probe_cache:
+            return self._probe_cache[key]
+
+        cmd = [
+            _FFPROBE,
+            '-v', 'error',
+            '-show_streams',
+            '-show_format',
+            '-of', 'json',
+            video_path
+        ]
+
+        result = subprocess.run(
+            cmd,
+            creationflags=_CREATE_NO_WINDOW,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+
+        if result.returncode != 0:
+            raise Exception(f"FFprobe error: {result.stderr}")
+
+        probe = json.loads(result.stdout)
+        self._probe_cache[key] = probe
+        return probe
+
+    def probe_duration(self, video_path: str) -> float:
+        """Return a video's duration in seconds (0.0 if unknown), probing at most once."""
+        return self._probe_duration(self._probe(video_path))
+
+    @staticmethod
+    def _probe_duration(probe: Dict) -> float:
+        """Return the container duration in seconds, or 0.0 if unknown."""
+        return float(probe.get('format', {}).get('duration', 0.0))
+
+    @staticmethod
+    def _probe_audio_codec(probe: Dict) -> str:
+        """Return the codec name of the first audio stream, or '' if none."""
+        for stream in probe.get('streams', []):
+            if stream.get('codec_type') == 'audio':
+                return stream.get('codec_name', '')
+        return ''
+
+    def extract_audio(self, video_path: str) -> np.ndarray:
+        """Extract audio from video as 16 kHz mono float32 samples."""
         self.logger.info("Extracting audio from video")
-        audio_path = os.path.splitext(video_path)[0] + "_temp.wav"
 
         try:
             cmd = [
-                'ffmpeg',
+                _FFMPEG,
+                '-nostdin',
+                '-loglevel', 'error',
                 '-i', video_path,
                 '-vn',
+                '-f', 's16le',
                 '-acodec', 'pcm_s16le',
-                '-ar', '16000',
+                '-ar', str(_SAMPLE_RATE),
                 '-ac', '1',
-                audio_path,
-                '-y'
+                '-'
             ]
 
-            shell = True if os.name == 'nt' else False
             result = subprocess.run(
                 cmd,
-                shell=shell,
+                creationflags=_CREATE_NO_WINDOW,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.PIPE
             )
 
             if result.returncode != 0:
-                raise Exception(f"FFmpeg error: {result.stderr}")
+                raise Exception(f"FFmpeg error: {result.stderr.decode(errors='replace')}")
 
-            return audio_path
+            return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
 
         except Exception as e:
             self.logger.error(f"Error extracting audio: {str(e)}")
             raise
 
 
+    def _scan_cache(self) -> set:
+        """Find downloaded models with a single read of the cache directory."""
+        with os.scandir(self.cache_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+
+        # Hugging Face hub cache layout: models--<org>--<repo>/snapshots/<rev>/model.bin
+        downloaded = set()
+        for model_name in ModelInfo.SIZES:
+            model_dir = self._model_dir(model_name)
+            if model_dir.name in present and any(model_dir.glob('snapshots/*/model.bin')):
+                downloaded.add(model_name)
+        return downloaded
+
+    def _model_dir(self, model_name: str) -> Path:
+        """Return the hub cache directory that holds a model's files."""
+        return self.cache_dir / ("models--" + ModelInfo.SIZES[model_name]['repo'].replace('/', '--'))
+
+    def cached_models(self) -> Dict[str, int]:
+        """Map each downloaded model to the bytes it occupies on disk."""
+        sizes = {}
+        for model_name in ModelInfo.SIZES:
+            if self.is_model_downloaded(model_name):
+                # Snapshots are symlinks into blobs/, which holds the data
+                blobs = self._model_dir(model_name) / 'blobs'
+                sizes[model_name] = sum(f.stat().st_size for f in blobs.iterdir() if f.is_file())
+        return sizes
+
+    def remove_model(self, model_name: str) -> None:
+        """Delete a downloaded model from the cache."""
+        if self.current_model_name == model_name:
+            self.current_model = None
+            self.current_model_name = None
+        if self._model_future_key is not None and self._model_future_key[0] == model_name:
+            self._model_future = None
+            self._model_future_key = None
+
+        shutil.rmtree(self._model_dir(model_name), ignore_errors=True)
+        self._downloaded_models = None
+        self.logger.info(f"Model {model_name} removed from cache")
+
     def is_model_downloaded(self, model_name: str) -> bool:
         """Check if a model is already downloaded."""
-        if model_name == "large":
-            model_path = self.cache_dir / "large-v3.pt"
-        else:
-            model_path = self.cache_dir / f"{model_name}.pt"
-        return model_path.exists()
+        # A model directory appearing or vanishing changes the cache dir's
+        # mtime, so one stat tells whether the last scan still holds
+        mtime = self.cache_dir.stat().st_mtime_ns
+        if self._downloaded_models is None or mtime != self._downloaded_models_mtime:
+            self._downloaded_models = self._scan_cache()
+            self._downloaded_models_mtime = mtime
+        return model_name in self._downloaded_models
 
     def check_disk_space(self, required_bytes: int) -> bool:
         """Check if there is enough disk space."""
         free_space = shutil.disk_usage(self.cache_dir).free
         return free_space > required_bytes * 1.2
 
-    def download_model(self, model_name: str) -> bool:
+    def _load_model(self, model_name: str, compute_type: str = "auto") -> "WhisperModel":
+        """Load a faster-whisper (CTranslate2) model, downloading it if needed."""
+        import ctranslate2
+        from faster_whisper import WhisperModel
+
+        gpu = ctranslate2.get_cuda_device_count() > 0
+
+        # "auto" trades a little accuracy for speed: int8 weights with fp16
+        # activations on GPU, plain int8 on CPU
+        if compute_type == "auto":
+            compute_type = "int8_float16" if gpu else "int8"
+
+        # On CPU, run one model worker per group of cores so chunks can be
+        # transcribed in parallel (CTranslate2 releases the GIL)
+        if gpu:
+            self._transcribe_workers = 1
+        else:
+            self._transcribe_workers = max(1, (os.cpu_count() or 1) // _CPU_THREADS_PER_WORKER)
+
+        model = WhisperModel(
+            ModelInfo.SIZES[model_name]['repo'],
+            device="cuda" if gpu else "cpu",
+            compute_type=compute_type,
+            cpu_threads=_CPU_THREADS_PER_WORKER,
+            num_workers=self._transcribe_workers,
+            download_root=str(self.cache_dir)
+        )
+
+        # Loading may have downloaded the model; rescan on next query
+        self._downloaded_models = None
+        return model
+
+    def _speech_chunks(self, audio: np.ndarray) -> list:
+        """Group VAD speech regions into (start, end) sample ranges of about a minute."""
+        from faster_whisper.vad import VadOptions, get_speech_timestamps
+
+        chunks = []
+        for region in get_speech_timestamps(audio, VadOptions()):
+            if chunks and region['end'] - chunks[-1][0] <= _CHUNK_SECONDS * _SAMPLE_RATE:
+                chunks[-1] = (chunks[-1][0], region['end'])
+            else:
+                chunks.append((region['start'], region['end']))
+        return chunks
+
+    def _transcribe(self, audio: np.ndarray, language: str):
+        """Yield (start, end, text) for each transcribed segment, in order."""
+        language = None if language == "auto" else language
+        # Bound once: a download or removal may reset current_model while
+        # chunks are still in flight
+        model = self.current_model
+
+        def run(chunk, chunk_language):
+            start, end = chunk
+            segments, info = model.transcribe(
+                audio[start:end], language=chunk_language, beam_size=5, vad_filter=True)
+            offset = start / _SAMPLE_RATE
+            return info.language, [(offset + seg.start, offset + seg.end, seg.text)
+                                   for seg in segments]
+
+        chunks = []
+        if self._transcribe_workers > 1 and len(audio) > 2 * _CHUNK_SECONDS * _SAMPLE_RATE:
+            chunks = self._speech_chunks(audio)
+
+        if len(chunks) < 2:
+            # Short audio or a single worker: one lazy pass over the whole file
+            segments, _ = model.transcribe(
+                audio, language=language, beam_size=5, vad_filter=True)
+            for seg in segments:
+                yield seg.start, seg.end, seg.text
+            return
+
+        # The first chunk settles the language so auto-detect is not
+        # repeated (and possibly disagreeing) in every chunk
+        detected, segments = run(chunks[0], language)
+        yield from segments
+
+        with ThreadPoolExecutor(max_workers=self._transcribe_workers) as executor:
+            for _, segments in executor.map(lambda c: run(c, language or detected), chunks[1:]):
+                yield from segments
+
+    def _request_model(self, model_name: str, compute_type: str = "auto") -> Future:
+        """Start loading a model in the background unless it is already loading."""
+        key = (model_name, compute_type)
+        if self._model_future is None or self._model_future_key != key:
+            self._model_future = self._model_executor.submit(self._load_model, model_name, compute_type)
+            self._model_future_key = key
+        return self._model_future
+
+    def preload_model(self, model_name: str, compute_type: str = "auto") -> None:
+        """Start loading a downloaded model in the background; never downloads."""
+        if self.is_model_downloaded(model_name):
+            self._request_model(model_name, compute_type)
+
+    def _acquire_model(self, model_name: str, compute_type: str = "auto") -> "WhisperModel":
+        """Wait for a model requested with _request_model and make it current."""
+        try:
+            self.current_model = self._request_model(model_name, compute_type).result()
+        except Exception:
+            # Do not keep handing out a failed load
+            self._model_future = None
+            raise
+        self.current_model_name = model_name
+        return self.current_model
+
+    def download_model(self, model_name: str, compute_type: str = "auto") -> bool:
         """Download a Whisper model."""
         try:
             required_space = ModelInfo.SIZES[model_name]['size']
             if not self.check_disk_space(required_space):
                 raise Exception("Insufficient disk space")
 
-            import os
-            import whisper
-
-            # Set Whisper's download directory to our cache directory
-            os.environ["XDG_CACHE_HOME"] = str(self.cache_dir.parent)
+            # Drop every reference to the old model; CTranslate2 frees its
+            # CPU/GPU buffers as soon as the object is released
+            self.current_model = None
+            self._model_future = None
 
-            if self.current_model is not None:
-                del self.current_model
-                import gc
-                gc.collect()
-
-            self.current_model = whisper.load_model(model_name)
+            self._acquire_model(model_name, compute_type)
             return True
 
         except Exception as e:
             self.logger.error(f"Error downloading model: {str(e)}")
             raise
 
-    def create_subtitles(self, video_path: str, srt_path: str, model_name: str,
-                        language: str = "auto", progress_callback=None) -> bool:
-        """Create subtitles for a video."""
-        try:
-            if progress_callback:
-                progress_callback("Loading model...", 10)
+    def transcribe_segments(self, video_path: str, model_name: str, language: str = "auto",
+                            compute_type: str = "auto", duration: float = None,
+                            progress_callback=None):
+        """Yield (start, end, text) for each segment of a video as it is decoded."""
+        if progress_callback:
+            progress_callback("Loading model...", 10)
 
-            if not self.current_model:
-                self.current_model = whisper.load_model(model_name)
+        # Load the model in the background while ffmpeg extracts audio
+        self._request_model(model_name, compute_type)
 
-            # Backup existing SRT file if needed
-            if os.path.exists(srt_path):
-                backup_path = srt_path + '.bak'
-                shutil.copy2(srt_path, backup_path)
+        if progress_callback:
+            progress_callback("Extracting audio...", 20)
 
-            if progress_callback:
-                progress_callback("Extracting audio...", 20)
+        # Probe once; the metadata is reused by burn_subtitles
+        if duration is None:
+            duration = self.probe_duration(video_path)
 
-            # Estract audio
-            audio_path = self.extract_audio(video_path)
+        # Extract audio straight into memory, no temporary WAV file
+        audio = self.extract_audio(video_path)
 
-            if progress_callback:
-                progress_callback("Transcribing audio...", 40)
+        if progress_callback:
+            progress_callback("Waiting for model...", 35)
 
-            # Transcribe audio
-            options = {
-                "language": None if language == "auto" else language,
-                "task": "transcribe",
-                "verbose": False
-            }
+        self._acquire_model(model_name, compute_type)
 
-            result = self.current_model.transcribe(audio_path, **options)
+        if progress_callback:
+            progress_callback("Transcribing audio...", 40)
 
-            if progress_callback:
-                progress_callback("Creating SRT file...", 80)
-
-            # Create SRT file
-            srt_content = []
-            for i, seg in enumerate(result["segments"], 1):
-                start_time = self.format_timestamp(seg["start"])
-                end_time = self.format_timestamp(seg["end"])
-                text = seg["text"].strip()
-                srt_content.extend([
-                    str(i),
-                    f"{start_time} --> {end_time}",
-                    text + "\n"
-                ])
-
-            with open(srt_path, 'w', encoding='utf-8') as f:
-                f.write("\n".join(srt_content))
-
-            # Clean temporary files
-            os.remove(audio_path)
+        duration = duration or len(audio) / _SAMPLE_RATE
+
+        for start, end, text in self._transcribe(audio, language):
+            yield start, end, text
+
+            if progress_callback and duration:
+                percent = min(end / duration, 1.0)
+                progress_callback("Transcribing audio...", 40 + int(50 * percent))
+
+    def create_subtitles(self, video_path: str, srt_path: str, model_name: str,
+                        language: str = "auto", compute_type: str = "auto",
+                        duration: float = None, progress_callback=None) -> bool:
+        """Create subtitles for a video."""
+        try:
+            segments = self.transcribe_segments(video_path, model_name, language,
+                                                compute_type, duration, progress_callback)
+
+            # Write each SRT block as soon as its segment is decoded; only
+            # the text needs UTF-8 encoding, the scaffolding is ASCII
+            tmp_path = srt_path + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    for i, (start, end, text) in enumerate(segments, 1):
+                        f.write(b"%d\n%b --> %b\n%b\n\n" % (
+                            i,
+                            self.format_timestamp(start).encode('ascii'),
+                            self.format_timestamp(end).encode('ascii'),
+                            text.strip().encode('utf-8')
+                        ))
+
+                # Keep the previous SRT as a backup and move the new one into
+                # place; both are renames, so nothing is copied and a failed
+                # run leaves the old file untouched
+                if os.path.exists(srt_path):
+                    os.replace(srt_path, srt_path + '.bak')
+                os.replace(tmp_path, srt_path)
+            except Exception:
+                # Don't leave a half-written SRT beside the user's video
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
 
             if progress_callback:
                 progress_callback("Subtitles created successfully!", 100)
@@ -193,8 +637,15 @@ class SubtitleProcessor:
                        video_quality: str = "23", video_preset: str = "medium",
                        background_color: str = "none", uppercase: bool = False,
                        word_by_word: bool = False, subtitle_position: str = "bottom",
-                       margin_left: int = 50,
+                       margin_left: int = 50, video_encoder: str = "auto",
+                       faststart: bool = True, tune: str = "none", threads: int = 0,
+                       spare_core: bool = False, soft_subtitles: bool = False,
+                       hw_decode: bool = False, duration: float = None,
                        progress_callback=None) -> bool:
+        if soft_subtitles:
+            return self.mux_subtitles(input_video, srt_path, output_video, faststart,
+                                      duration, progress_callback)
+
         try:
             if progress_callback:
                 progress_callback("Preparing burning process...", 10)
@@ -208,108 +659,240 @@ class SubtitleProcessor:
             else:
                 modified_srt_path = srt_path
 
-
             # Prepare style with additional options
-            style_components = [
-                f"FontSize={font_size}",
-                f"FontName={font_name}",
-                f"PrimaryColour={self.convert_color_to_hex(font_color)}",
-                f"OutlineColour={self.convert_color_to_hex(font_outline)}",
-                f"MarginL={margin_left}",
-                f"MarginR=50",
-                f"MarginV=20",
-                "Outline=1",
-                "Shadow=1"
-            ]
-
+            style = self._build_style(font_size, font_name, font_color, font_outline,
+                                      background_color, subtitle_position, margin_left)
 
-            # Add subtitle positioning
-            style_components.append(f"Alignment={self._get_alignment(subtitle_position)}")
+            if progress_callback:
+                progress_callback("Burning subtitles...", 30)
 
-            # Add background color if specified
-            if background_color == "none":
-                style_components.extend([
-                    "BorderStyle=1",
-                    "Outline=1"
-                ])
+            # Keep AAC audio as-is instead of re-encoding it
+            if self._probe_audio_codec(self._probe(input_video)) == 'aac':
+                audio_args = ['-c:a', 'copy']
             else:
-                # Configure background
-                style_components.extend([
-                    f"BackColour={self.convert_color_to_hex(background_color)}",
-                    "BorderStyle=3",
-                    "Outline=1"
-                ])
+                audio_args = ['-c:a', 'aac', '-b:a', '192k']
+
+            if duration is None:
+                duration = self.probe_duration(input_video)
+            duration_us = int(duration * 1_000_000)
+
+            # Try the detected encoder first, falling back to libx264 if the
+            # hardware encoder is listed but fails to start (e.g. no GPU present)
+            if video_encoder == "auto":
+                video_encoder = self.available_video_encoders[0]
+            encoders = [video_encoder]
+            if video_encoder != 'libx264':
+                encoders.append('libx264')
+
+            # Leave CPU 0 to the UI so the encode cannot starve repaints
+            cpu_count = os.cpu_count() or 1
+            if spare_core and _TASKSET and cpu_count > 1:
+                affinity_args = [_TASKSET, '-c', f'1-{cpu_count - 1}']
+            else:
+                affinity_args = []
+
+            subtitles_filter = f"subtitles='{modified_srt_path}':force_style='{style}'"
+
+            for encoder in encoders:
+                # libass draws on the CPU, so VAAPI frames are uploaded to
+                # the GPU only after the subtitles are in place
+                if encoder == 'h264_vaapi':
+                    device_args = ['-vaapi_device', _VAAPI_DEVICE]
+                    video_filter = subtitles_filter + ',format=nv12,hwupload'
+                else:
+                    device_args = []
+                    video_filter = subtitles_filter
+
+                ffmpeg_cmd = [
+                    *affinity_args,
+                    _FFMPEG, '-nostdin', '-loglevel', 'error',
+                    # GPU decoding on the first attempt only; the retry is
+                    # all-software in case decoding was what failed
+                    *(['-hwaccel', 'auto'] if hw_decode and encoder == encoders[0] else []),
+                    *device_args,
+                    '-i', input_video,
+                    '-vf', video_filter,
+                    *self._video_codec_args(encoder, video_quality, video_preset, tune),
+                    # 0 lets ffmpeg use every core
+                    *(['-threads', str(threads)] if threads else []),
+                    *audio_args,
+                    # Move the index to the front so playback can start
+                    # before the whole file has downloaded
+                    *(['-movflags', '+faststart'] if faststart else []),
+                    '-progress', 'pipe:1',
+                    '-nostats',
+                    output_video,
+                    '-y'
+                ]
+
+                returncode, stderr = self._run_ffmpeg(ffmpeg_cmd, duration_us, progress_callback)
+                if returncode == 0:
+                    break
+                self.logger.warning(f"Encoding with {encoder} failed: {stderr}")
+                # A bad input, a subtitle/font error or a full disk would fail
+                # the same way with libx264; only retry when the encoder
+                # itself could not be opened
+                if not any(marker in stderr for marker in _ENCODER_INIT_ERRORS):
+                    break
+
+            if returncode != 0:
+                raise RuntimeError(f"FFmpeg error: {stderr}")
 
+            # Clean up modified subtitle file if it was created
+            if modified_srt_path != srt_path:
+                os.remove(modified_srt_path)
 
-            style = ",".join(style_components)
+            if progress_callback:
+                progress_callback("Burning completed!", 100)
+
+            return True
 
+        except Exception as e:
+            self.logger.error(f"Error burning subtitles: {str(e)}")
+            raise
 
+    def mux_subtitles(self, input_video: str, srt_path: str, output_video: str = None,
+                      faststart: bool = True, duration: float = None,
+                      progress_callback=None) -> bool:
+        """Add the SRT as a soft subtitle track, copying audio and video as-is."""
+        try:
             if progress_callback:
-                progress_callback("Burning subtitles...", 30)
+                progress_callback("Adding subtitle track...", 10)
+
+            if output_video is None:
+                output_video = os.path.splitext(input_video)[0] + "_subbed.mp4"
+
+            if duration is None:
+                duration = self.probe_duration(input_video)
+            duration_us = int(duration * 1_000_000)
+
+            # MP4/MOV only take mov_text, and only they have a moov atom to move
+            extension = os.path.splitext(output_video)[1].lower()
+            subtitle_codec = _SOFT_SUBTITLE_CODECS.get(extension, 'mov_text')
+            faststart = faststart and subtitle_codec == 'mov_text'
 
             ffmpeg_cmd = [
-                'ffmpeg', '-i', input_video,
-                '-vf', f"subtitles='{modified_srt_path}':force_style='{style}'",
-                '-c:v', 'libx264',
-                '-preset', video_preset,
-                '-crf', video_quality,
-                '-c:a', 'aac',
-                '-b:a', '192k',
+                _FFMPEG, '-nostdin', '-loglevel', 'error',
+                '-i', input_video,
+                '-i', srt_path,
+                '-map', '0:v', '-map', '0:a?', '-map', '1:0',
+                '-c:v', 'copy',
+                '-c:a', 'copy',
+                '-c:s', subtitle_codec,
+                *(['-movflags', '+faststart'] if faststart else []),
+                '-progress', 'pipe:1',
+                '-nostats',
                 output_video,
                 '-y'
             ]
 
-            process = subprocess.Popen(
-                ffmpeg_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-
-            stdout, stderr = process.communicate()
-
-            if process.returncode != 0:
+            returncode, stderr = self._run_ffmpeg(ffmpeg_cmd, duration_us, progress_callback)
+            if returncode != 0:
                 raise RuntimeError(f"FFmpeg error: {stderr}")
 
-            # Clean up modified subtitle file if it was created
-            if modified_srt_path != srt_path:
-                os.remove(modified_srt_path)
-
             if progress_callback:
-                progress_callback("Burning completed!", 100)
+                progress_callback("Subtitle track added!", 100)
 
             return True
 
         except Exception as e:
-            self.logger.error(f"Error burning subtitles: {str(e)}")
+            self.logger.error(f"Error adding subtitle track: {str(e)}")
             raise
 
+    def process_batch(self, jobs: list, progress_callback=None, **burn_options) -> list:
+        """Burn subtitles into several videos concurrently.
+
+        jobs is a list of (input_video, srt_path) pairs; burn_options are
+        passed through to burn_subtitles. Returns the output video paths.
+        """
+        outputs = [os.path.splitext(video)[0] + "_subbed.mp4" for video, _ in jobs]
+        percents = [0] * len(jobs)
+
+        def burn(index):
+            (video, srt), output = jobs[index], outputs[index]
+
+            def report(status, value):
+                # One bar for the whole batch: the mean of every job's progress
+                percents[index] = value
+                if progress_callback:
+                    progress_callback(f"Burning {len(jobs)} videos...", sum(percents) // len(jobs))
+
+            return self.burn_subtitles(video, srt, output, **burn_options,
+                                       progress_callback=report)
+
+        # ffmpeg does the heavy lifting in its own process, so threads are
+        # enough to keep several encodes running side by side; split the
+        # cores between them instead of letting each one claim all of them
+        if not burn_options.get('threads'):
+            burn_options['threads'] = max(1, (os.cpu_count() or 1) // _BATCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+            for done, _ in enumerate(executor.map(burn, range(len(jobs))), 1):
+                if progress_callback:
+                    progress_callback(f"Burned {done}/{len(jobs)} videos", sum(percents) // len(jobs))
+
+        return outputs
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _build_style(font_size: str, font_name: str, font_color: str, font_outline: str,
+                     background_color: str, subtitle_position: str, margin_left: int) -> str:
+        """Build the force_style string for the subtitles filter."""
+        convert = SubtitleProcessor.convert_color_to_hex
+
+        # Prepare style with additional options
+        style_components = [
+            f"FontSize={font_size}",
+            f"FontName={font_name}",
+            f"PrimaryColour={convert(font_color)}",
+            f"OutlineColour={convert(font_outline)}",
+            f"MarginL={margin_left}",
+            f"MarginR=50",
+            f"MarginV=20",
+            "Outline=1",
+            "Shadow=1"
+        ]
+
+        # Add subtitle positioning
+        style_components.append(f"Alignment={SubtitleProcessor._get_alignment(subtitle_position)}")
+
+        # Add background color if specified
+        if background_color == "none":
+            style_components.extend([
+                "BorderStyle=1",
+                "Outline=1"
+            ])
+        else:
+            # Configure background
+            style_components.extend([
+                f"BackColour={convert(background_color)}",
+                "BorderStyle=3",
+                "Outline=1"
+            ])
+
+        return ",".join(style_components)
+
     def modify_subtitle_file(self, input_srt: str, uppercase: bool = False, word_by_word: bool = False) -> str:
         """Modify subtitle file based on specified options."""
         try:
             # Create a new modified SRT file
             output_srt = os.path.splitext(input_srt)[0] + "_modified.srt"
 
-            with open(input_srt, 'r', encoding='utf-8') as infile, \
-                 open(output_srt, 'w', encoding='utf-8') as outfile:
-
-                for line in infile:
-                    # Check if this is a subtitle text line
-                    if '-->' not in line and line.strip().isdigit() == False and line.strip():
-                        text = line.strip()
+            with open(input_srt, 'r', encoding='utf-8') as infile:
+                content = infile.read()
 
-                        # Apply uppercase if selected
-                        if uppercase:
-                            text = text.upper()
+            # Counter and timestamp lines contain no letters or blank runs,
+            # so both options can run over the whole buffer in C instead of
+            # calling back into Python for every text line.
+            # Apply word-by-word if selected (collapse runs of whitespace)
+            if word_by_word:
+                content = _BLANK_RUNS.sub(' ', content)
 
-                        # Apply word-by-word if selected
-                        if word_by_word:
-                            text = ' '.join([word for word in text.split()])
+            # Apply uppercase if selected
+            if uppercase:
+                content = content.upper()
 
-                        outfile.write(text + '\n')
-                    else:
-                        # Write other lines as they are
-                        outfile.write(line)
+            with open(output_srt, 'w', encoding='utf-8') as outfile:
+                outfile.write(_LINE_BLANKS.sub('', content))
 
             return output_srt
 
@@ -317,73 +900,112 @@ class SubtitleProcessor:
             self.logger.error(f"Error modifying subtitle file: {str(e)}")
             raise
 
-    def convert_color_to_hex(self, color_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def convert_color_to_hex(color_name: str) -> str:
         """Converts color name to hexadecimal format for FFmpeg subtitles (BGR format)."""
-        color_map = {
-            'white': '&HFFFFFF&',    # BGR: 255,255,255
-            'yellow': '&H00FFFF&',   # BGR: 0,255,255
-            'black': '&H000000&',    # BGR: 0,0,0
-            'green': '&H00FF00&',    # BGR: 0,255,0
-            'cyan': '&HFFFF00&',     # BGR: 255,255,0
-            'gray': '&H808080&',     # BGR: 128,128,128
-            'none': ''               # Nessun colore
-        }
-        return color_map.get(color_name.lower(), '&HFFFFFF&')
+        return _COLOR_MAP.get(color_name.lower(), '&HFFFFFF&')
+
+    def extract_subtitle_streams(self, video_path: str) -> list:
+        """Extract every text subtitle stream to SRT in a single ffmpeg pass.
+
+        Returns the SRT paths in stream order. Results are reused until the
+        source file changes.
+        """
+        key = (video_path, os.stat(video_path).st_mtime_ns)
+        if key in self._subtitle_cache:
+            return self._subtitle_cache[key]
+
+        streams = [stream for stream in self._probe(video_path).get('streams', [])
+                   if stream.get('codec_type') == 'subtitle']
+
+        # One input, one output per stream: the container is read once no
+        # matter how many tracks it carries
+        base = os.path.splitext(video_path)[0]
+        cmd = [_FFMPEG, '-nostdin', '-loglevel', 'error', '-i', video_path]
+        outputs = []
+        for i, stream in enumerate(streams):
+            if stream.get('codec_name') in _BITMAP_SUBTITLE_CODECS:
+                continue
+            output = f"{base}.track{i}.srt"
+            cmd += ['-map', f'0:s:{i}', '-c:s', 'srt', output]
+            outputs.append(output)
+
+        if outputs:
+            result = subprocess.run(
+                cmd + ['-y'],
+                creationflags=_CREATE_NO_WINDOW,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"FFmpeg error: {result.stderr}")
 
+        self._subtitle_cache[key] = outputs
+        return outputs
 
+    def translate_subtitles(self, input_srt: str, from_lang: str, to_lang: str,
+                            extract_all_streams: bool = False) -> str:
+        """Translate subtitles.
 
-    def translate_subtitles(self, input_srt: str, from_lang: str, to_lang: str) -> str:
-        """Translate subtitles."""
+        With extract_all_streams, input_srt may be any file ffmpeg can read
+        subtitles from (a video, .ass, ...); every text subtitle stream is
+        extracted and translated, and the first translation is returned.
+        """
         try:
-            output_srt = os.path.splitext(input_srt)[0] + f"_{to_lang}.srt"
-            self.translator.translate_srt(input_srt, output_srt, from_lang, to_lang)
-            return output_srt
+            if extract_all_streams:
+                sources = self.extract_subtitle_streams(input_srt)
+                if not sources:
+                    raise ValueError(f"No text subtitle streams found in {input_srt}")
+            else:
+                sources = [input_srt]
+
+            outputs = [os.path.splitext(source)[0] + f"_{to_lang}.srt" for source in sources]
+            self.translator.translate_srt_many(list(zip(sources, outputs)), from_lang, to_lang)
+            return outputs[0]
         except Exception as e:
             self.logger.error(f"Error translating subtitles: {str(e)}")
             raise
 
-    def _get_alignment(self, position: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _get_alignment(position: str) -> str:
         """Convert position to FFmpeg subtitle alignment."""
-        alignment_map = {
-            "top center": "8",     # Top center
-            "bottom": "2"          # Bottom center (default)
-        }
-        return alignment_map.get(position, "2")  # Default to bottom
+        return _ALIGNMENT_MAP.get(position, "2")  # Default to bottom
 
 
-    def load_settings(self) -> Dict:
+    def load_settings(self) -> AppSettings:
         """Load saved settings."""
         try:
             settings_path = Path.home() / '.subtitle_app' / 'settings.json'
             if settings_path.exists():
-                with open(settings_path, 'r') as f:
-                    settings = json.load(f)
-                    self.logger.info("Settings loaded successfully")
-                    return settings
-            return {
-                'font_size': "24",
-                'font_name': "Arial",
-                'font_color': "white",
-                'font_outline': "black",
-                'background_color': "none",
-                'uppercase': False,
-                'word_by_word': False,
-                'whisper_model': "base",
-                'whisper_language': "auto",
-                'video_quality': "23",
-                'video_preset': "medium"
-            }
+                data = settings_path.read_bytes()
+                settings = AppSettings.from_dict(json.loads(data))
+                self._saved_settings = data
+                self.logger.info("Settings loaded successfully")
+                return settings
+            return AppSettings()
         except Exception as e:
             self.logger.error(f"Error loading settings: {str(e)}")
             raise
 
-    def save_settings(self, settings: Dict) -> bool:
+    def save_settings(self, settings: AppSettings) -> bool:
         """Save the current settings."""
         try:
+            data = json.dumps(asdict(settings), indent=4).encode('utf-8')
+            if data == self._saved_settings:
+                return True
+
             settings_path = Path.home() / '.subtitle_app'
             settings_path.mkdir(parents=True, exist_ok=True)
-            with open(settings_path / 'settings.json', 'w') as f:
-                json.dump(settings, f, indent=4)
+
+            # Write beside the real file and rename over it, so a crash
+            # mid-write never leaves a truncated settings.json behind
+            tmp_path = settings_path / 'settings.json.tmp'
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, settings_path / 'settings.json')
+            self._saved_settings = data
             self.logger.info("Settings saved successfully")
             return True
         except Exception as e:
@@ -0,0 +1,59 @@
+# core/settings.py
+
+from dataclasses import dataclass, fields
+
+@dataclass(frozen=True, slots=True)
+class BurnSettings:
+    """Options for SubtitleProcessor.burn_subtitles, captured on the UI thread."""
+
+    font_size: str = "24"
+    font_name: str = "Arial"
+    font_color: str = "white"
+    font_outline: str = "black"
+    video_quality: str = "23"
+    video_preset: str = "medium"
+    background_color: str = "none"
+    uppercase: bool = False
+    word_by_word: bool = False
+    subtitle_position: str = "bottom"
+    margin_left: int = 50
+    video_encoder: str = "auto"
+    faststart: bool = True
+    tune: str = "none"
+    threads: int = 0
+    spare_core: bool = False
+    soft_subtitles: bool = False
+    hw_decode: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class AppSettings:
+    """Window state persisted to settings.json between runs."""
+
+    font_size: str = "24"
+    font_name: str = "Arial"
+    font_color: str = "white"
+    font_outline: str = "black"
+    background_color: str = "none"
+    uppercase: bool = False
+    word_by_word: bool = False
+    whisper_model: str = "base"
+    whisper_language: str = "auto"
+    compute_type: str = "auto"
+    video_quality: str = "23"
+    video_preset: str = "medium"
+    video_encoder: str = "auto"
+    video_tune: str = "none"
+    faststart: bool = True
+    video_threads: int = 0
+    spare_core: bool = False
+    soft_subtitles: bool = False
+    hw_decode: bool = False
+    subtitle_position: str = "bottom"
+    margin_left: int = 200
+    last_dir: str = ""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AppSettings":
+        """Build settings from a saved dict, ignoring keys this version does not know."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.name in data})
@@ -1,22 +1,47 @@
 # gui/main_window.py
 
-from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
+from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout,
                            QHBoxLayout, QLabel, QLineEdit, QComboBox, QPushButton,
-                           QProgressBar, QFileDialog, QGroupBox, QMessageBox, QGridLayout, QCheckBox, QSlider)
-from PyQt6.QtCore import Qt, pyqtSignal, QRunnable, QThreadPool, QObject
+                           QProgressBar, QFileDialog, QGroupBox, QMessageBox, QGridLayout, QCheckBox, QSlider,
+                           QSpinBox, QRadioButton)
+from PyQt6.QtCore import (Qt, pyqtSignal, QRunnable, QThread, QThreadPool, QObject, QTimer,
+                          QMutex, QMutexLocker, QUrl, QStringListModel)
 import os
-import sys
-import humanize
+from dataclasses import asdict
 from pathlib import Path
 
 from core.processor import SubtitleProcessor
 from core.model_info import ModelInfo
+from core.settings import AppSettings, BurnSettings
+
+# Combo box entries that never change, built once at import
+_MODEL_NAMES = tuple(ModelInfo.SIZES)
+_MODEL_INFO_STRINGS = tuple(ModelInfo.format_info(name, info)
+                            for name, info in ModelInfo.SIZES.items())
+_LANG_CODES = tuple(ModelInfo.LANGUAGES)
+_LANG_STRINGS = tuple(f"{code} - {name}" for code, name in ModelInfo.LANGUAGES.items())
+
+_COMPUTE_TYPES = ("auto", "int8", "int8_float16", "float16", "float32")
+_FONT_SIZES = ("16", "20", "24", "28", "32", "36", "40", "48")
+_FONT_NAMES = ("Arial", "Times New Roman", "Helvetica", "Courier")
+_FONT_COLORS = ("white", "yellow", "green", "cyan")
+_OUTLINE_COLORS = ("black", "white", "none")
+_BACKGROUND_COLORS = ("none", "black", "white", "gray")
+_POSITIONS = ("bottom", "top center")
+_QUALITIES = ("20", "23", "26")
+_PRESETS = ("ultrafast", "superfast", "veryfast", "faster", "fast", "medium", "slow")
+_TUNES = ("none", "film", "animation", "zerolatency", "ssim")
+
+# Model name / language code -> combo index, for restoring saved settings
+_MODEL_INDEX = {m: i for i, m in enumerate(_MODEL_NAMES)}
+_LANG_INDEX = {code: i for i, code in enumerate(_LANG_CODES)}
 
 # Worker signals class
 class WorkerSignals(QObject):
     progress = pyqtSignal(str, int)
     error = pyqtSignal(str)
     success = pyqtSignal(str)
+    result = pyqtSignal(object)
     finished = pyqtSignal()
 
 class Worker(QRunnable):
@@ -27,18 +52,39 @@ class Worker(QRunnable):
         self.kwargs = kwargs
         self.signals = WorkerSignals()
 
-        # Add kwargs progress callback if supported
+        # Tasks that take a progress_callback report through the progress
+        # signal; the GUI coalesces bursts before painting
         if 'progress_callback' in kwargs:
-            kwargs['progress_callback'] = lambda status, value: self.signals.progress.emit(status, value)
+            kwargs['progress_callback'] = self.signals.progress.emit
 
     def run(self):
         try:
             result = self.fn(*self.args, **self.kwargs)
             if result:
+                self.signals.result.emit(result)
                 self.signals.success.emit(str(result))
-            self.signals.finished.emit()
         except Exception as e:
             self.signals.error.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+# Dedicated thread for the multi-minute transcribe + burn job, so it does
+# not hold a pool slot for its whole run
+class TranscribeThread(QThread):
+    progress = pyqtSignal(str, int)
+    error = pyqtSignal(str)
+    result = pyqtSignal(object)
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+
+    def run(self):
+        try:
+            self.result.emit(self.fn(*self.args, progress_callback=self.progress.emit))
+        except Exception as e:
+            self.error.emit(str(e))
 
 class SubtitleGUI(QMainWindow):
     def __init__(self):
@@ -46,11 +92,40 @@ class SubtitleGUI(QMainWindow):
         self.setWindowTitle("Subtitle Creator & Burner")
         self.setMinimumSize(800, 600)
 
-        # Initialize thread pool
+        # Initialize thread pools: short tasks (downloads, translation) and
+        # a single-slot pool so only one CPU-heavy burn job runs at a time;
+        # extra clicks queue instead of oversubscribing the CPU
         self.threadpool = QThreadPool()
+        self.job_pool = QThreadPool()
+        self.job_pool.setMaxThreadCount(1)
+
+        # Full transcribe + burn runs get their own thread; Download and
+        # Remove stay disabled while one is in flight
+        self._process_thread = None
+        self._transcribing = False
+
+        # Scrolling through the model combo only refreshes once it settles
+        self._ui_update_timer = QTimer(self)
+        self._ui_update_timer.setSingleShot(True)
+        self._ui_update_timer.setInterval(150)
+        self._ui_update_timer.timeout.connect(self._update_ui)
 
         # Initialize the processor
         self.processor = SubtitleProcessor()
+        self._last_dir = ""
+
+        # Path objects for the file fields, rebuilt only when the text changes
+        self._video_file = None
+        self._srt_file = None
+
+        # Progress updates are coalesced and painted at most every 60 ms,
+        # however fast ffmpeg/Whisper report them
+        self._progress_mutex = QMutex()
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(60)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        self._progress_timer.start()
 
         # Setup UI
         self.init_ui()
@@ -59,164 +134,280 @@ class SubtitleGUI(QMainWindow):
         self.load_saved_settings()
 
     def _update_progress(self, status: str, value: int):
-        """Update the UI in a thread-safe manner."""
-        self.status_label.setText(status)
-        self.progress_bar.setValue(value)
+        """Record the latest progress; safe to call from any thread."""
+        with QMutexLocker(self._progress_mutex):
+            self._pending_progress = (status, value)
+
+    def _flush_progress(self):
+        """Paint the most recent progress update, dropping older ones."""
+        with QMutexLocker(self._progress_mutex):
+            pending, self._pending_progress = self._pending_progress, None
+        if pending is not None:
+            status, value = pending
+            # Setting an unchanged value still schedules a repaint; when both
+            # change, repaint the progress box once instead of twice
+            text_changed = self.status_label.text() != status
+            value_changed = self.progress_bar.value() != value
+            if text_changed and value_changed:
+                self.progress_group.setUpdatesEnabled(False)
+            if text_changed:
+                self.status_label.setText(status)
+            if value_changed:
+                self.progress_bar.setValue(value)
+            if text_changed and value_changed:
+                self.progress_group.setUpdatesEnabled(True)
+
+    def _spawn(self, fn, *args, pool=None, progress=False, on_success=None, on_result=None,
+               on_error=None, on_finished=None) -> Worker:
+        """Run fn(*args) on a pool (the general one by default) and wire up its signals.
+
+        With progress, fn is also passed a progress_callback that reports to
+        the progress bar.
+        """
+        worker = Worker(fn, *args, **({'progress_callback': None} if progress else {}))
+        queued = Qt.ConnectionType.QueuedConnection
+        worker.signals.progress.connect(self._update_progress, queued)
+        worker.signals.error.connect(on_error or self._show_error, queued)
+        if on_success is not None:
+            worker.signals.success.connect(on_success, queued)
+        if on_result is not None:
+            worker.signals.result.connect(on_result, queued)
+        if on_finished is not None:
+            worker.signals.finished.connect(on_finished, queued)
+        (pool or self.threadpool).start(worker)
+        return worker
+
+    def _progress_done(self):
+        """Show a full bar once a job has finished."""
+        self._update_progress("Ready", 100)
+
+    def _progress_reset(self):
+        """Show an empty bar once a job has finished."""
+        self._update_progress("Ready", 0)
 
     def _show_error(self, message: str):
         """Show errors in a thread-safe manner."""
         QMessageBox.critical(self, "Error", message)
         self.process_button.setEnabled(True)
-        self.download_button.setEnabled(True)
+        self.update_model_status()
 
     def _show_success(self, message: str):
         """Show success messages in a thread-safe manner."""
         QMessageBox.information(self, "Success", message)
         self.process_button.setEnabled(True)
-        self.download_button.setEnabled(True)
+        self.update_model_status()
+
+    def _schedule_ui_update(self):
+        """Restart the debounce timer for _update_ui."""
+        self._ui_update_timer.start()
 
     def _update_ui(self):
         """Update UI elements in a thread-safe manner."""
         self.update_model_status()
         self.process_button.setEnabled(True)
-        self.download_button.setEnabled(True)
 
     def download_model(self):
         """Manages the download of the selected model."""
-        selected = self.model_combo.currentText().split()[0]
-
-        def do_download():
-            try:
-                worker.signals.progress.emit(f"Starting download of {selected} model...", 0)
-                worker.signals.progress.emit(f"Downloading {selected} model...", 20)
-                self.processor.download_model(selected)
-                worker.signals.progress.emit(f"Model {selected} downloaded successfully!", 100)
-                worker.signals.success.emit(f"Model {selected} downloaded successfully!")
-            except Exception as e:
-                worker.signals.error.emit(str(e))
-
-        worker = Worker(do_download)
-        worker.signals.progress.connect(self._update_progress)
-        worker.signals.error.connect(self._show_error)
-        worker.signals.success.connect(self._show_success)
-        worker.signals.finished.connect(self._update_ui)
+        selected = self.model_combo.currentData()
 
         self.download_button.setEnabled(False)
         self.process_button.setEnabled(False)
         self.progress_bar.setMaximum(100)
         self._update_progress("Preparing download...", 0)
 
-        self.threadpool.start(worker)
+        self._spawn(self._do_download, selected, self.compute_type.currentText(), progress=True,
+                    on_success=self._show_success, on_finished=self._update_ui)
+
+    def remove_model(self):
+        """Delete the selected model from the local cache."""
+        selected = self.model_combo.currentData()
+        self.remove_button.setEnabled(False)
+        # Measuring the model walks the cache, so it happens off the GUI thread
+        self._spawn(lambda: (selected, self.processor.cached_models().get(selected, 0)),
+                    on_result=self._confirm_remove_model)
+
+    def _confirm_remove_model(self, measured: tuple):
+        """Ask before deleting a measured model, then delete it in the background."""
+        selected, size = measured
+        reply = QMessageBox.question(
+            self, "Remove Model",
+            f"Delete the {selected} model ({size / 2**20:.0f} MiB) from the cache?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._spawn(self.processor.remove_model, selected,
+                        on_finished=self.update_model_status)
+        else:
+            self.update_model_status()
+
+    def _do_download(self, model_name: str, compute_type: str, progress_callback) -> str:
+        """Download a model (runs on a worker thread)."""
+        progress_callback(f"Starting download of {model_name} model...", 0)
+        progress_callback(f"Downloading {model_name} model...", 20)
+        self.processor.download_model(model_name, compute_type)
+        progress_callback(f"Model {model_name} downloaded successfully!", 100)
+        return f"Model {model_name} downloaded successfully!"
 
     def translate_srt(self):
         """Manages subtitle translation."""
+        if not self._languages_loaded:
+            self._populate_languages()
+            return
+
         try:
             # Validation checks
             if not self.srt_path.text():
                 self._show_error("No SRT file selected")
                 return
 
-            if not os.path.exists(self.srt_path.text()):
+            if not self._srt_file.is_file():
                 self._show_error("Selected SRT file does not exist")
                 return
 
-            def do_translate():
-                try:
-                    worker.signals.progress.emit("Starting translation...", 10)
-                    worker.signals.progress.emit("Translating subtitles...", 30)
-
-                    output_file = self.processor.translate_subtitles(
-                        self.srt_path.text(),
-                        self.trans_from.currentText(),
-                        self.trans_to.currentText()
-                    )
-
-                    worker.signals.progress.emit("Translation completed!", 100)
-                    return output_file
-
-                except Exception as e:
-                    worker.signals.error.emit(f"Translation error: {str(e)}")
-                    return None
-
-            worker = Worker(do_translate)
-            worker.signals.progress.connect(self._update_progress)
-            worker.signals.error.connect(self._show_error)
-            worker.signals.success.connect(self._handle_translation_complete)
-            worker.signals.finished.connect(lambda: self._update_progress("Ready", 100))
-
             self.progress_bar.setMaximum(100)
             self._update_progress("Preparing translation...", 0)
 
-            self.threadpool.start(worker)
+            self._spawn(self._do_translate, self.srt_path.text(),
+                        self.trans_from.currentText(), self.trans_to.currentText(), progress=True,
+                        on_success=self._handle_translation_complete,
+                        on_finished=self._progress_done)
 
         except Exception as e:
             self._show_error(f"Error initializing translation: {str(e)}")
 
+    def _do_translate(self, srt_path: str, from_lang: str, to_lang: str,
+                      progress_callback) -> str:
+        """Translate an SRT file (runs on a worker thread)."""
+        progress_callback("Starting translation...", 10)
+        progress_callback("Translating subtitles...", 30)
+
+        try:
+            # Anything but a plain SRT (a video, .ass, ...) has its subtitle
+            # streams extracted by ffmpeg first
+            output_file = self.processor.translate_subtitles(
+                srt_path, from_lang, to_lang,
+                extract_all_streams=not srt_path.lower().endswith('.srt'))
+        except Exception as e:
+            raise RuntimeError(f"Translation error: {str(e)}") from e
+
+        # Checked here rather than in the completion slot so a slow or
+        # network drive cannot stall the GUI thread
+        if not os.path.isfile(output_file):
+            raise RuntimeError("Translation failed - output file not found")
+
+        progress_callback("Translation completed!", 100)
+        return output_file
+
     def _handle_translation_complete(self, output_file):
         """Handle translation completion and ask user about using the translated file."""
-        if output_file and os.path.exists(output_file):
-            reply = QMessageBox.question(
-                self, "Success",
-                f"Translation completed!\nUse translated file?\n{output_file}",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-            )
-
-            if reply == QMessageBox.StandardButton.Yes:
-                self.srt_path.setText(output_file)
-        else:
-            self._show_error("Translation failed - output file not found")
+        reply = QMessageBox.question(
+            self, "Success",
+            f"Translation completed!\nUse translated file?\n{output_file}",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+
+        if reply == QMessageBox.StandardButton.Yes:
+            self.srt_path.setText(output_file)
+
+    def _burn_settings(self) -> BurnSettings:
+        """Snapshot the burn options from the widgets."""
+        return BurnSettings(
+            font_size=self.font_size.currentText(),
+            font_name=self.font_name.currentText(),
+            font_color=self.font_color.currentText(),
+            font_outline=self.font_outline.currentText(),
+            video_quality=self.video_quality.currentText(),
+            video_preset=self.video_preset.currentText(),
+            background_color=self.background_color.currentText(),
+            uppercase=self.uppercase_option.isChecked(),
+            word_by_word=self.word_by_word_option.isChecked(),
+            subtitle_position=self.subtitle_position.currentText(),
+            margin_left=self.margin_slider.value(),
+            video_encoder=self.video_encoder.currentText(),
+            faststart=self.faststart_option.isChecked(),
+            tune=self.video_tune.currentText(),
+            threads=self.video_threads.value(),
+            spare_core=self.spare_core_option.isChecked(),
+            soft_subtitles=self.soft_subs_option.isChecked(),
+            hw_decode=self.hw_decode_option.isChecked()
+        )
 
     def burn_subtitles(self):
         if not all([self.video_path.text(), self.srt_path.text()]):
             self._show_error("Both video and SRT files are required")
             return
 
-        def do_burn():
-            try:
-                worker.signals.progress.emit("Burning subtitles...", 50)
-                self.processor.burn_subtitles(
-                    self.video_path.text(),
-                    self.srt_path.text(),
-                    font_size=self.font_size.currentText(),
-                    font_name=self.font_name.currentText(),
-                    font_color=self.font_color.currentText(),
-                    font_outline=self.font_outline.currentText(),
-                    video_quality=self.video_quality.currentText(),
-                    video_preset=self.video_preset.currentText(),
-                    background_color=self.background_color.currentText(),
-                    uppercase=self.uppercase_option.isChecked(),
-                    word_by_word=self.word_by_word_option.isChecked(),
-                    subtitle_position=self.subtitle_position.currentText(),
-                    margin_left=self.margin_slider.value(),  # Pass slider value
-                    progress_callback=lambda status, value: worker.signals.progress.emit(status, value)
-                )
-
-                worker.signals.success.emit("Video processing completed!")
-            except Exception as e:
-                worker.signals.error.emit(str(e))
-
-        worker = Worker(do_burn)
-        worker.signals.progress.connect(self._update_progress)
-        worker.signals.error.connect(self._show_error)
-        worker.signals.success.connect(self._show_success)
-        worker.signals.finished.connect(lambda: self._update_progress("Ready", 0))
-
         self.process_button.setEnabled(False)
         self.progress_bar.setMaximum(100)
         self._update_progress("Starting burning process...", 0)
 
-        self.threadpool.start(worker)
+        self._spawn(self._do_burn, self.video_path.text(), self.srt_path.text(),
+                    self._burn_settings(), pool=self.job_pool, progress=True,
+                    on_success=self._show_success, on_finished=self._progress_reset)
+
+    def _do_burn(self, video_path: str, srt_path: str, settings: BurnSettings,
+                 progress_callback) -> str:
+        """Burn subtitles into a video (runs on a worker thread)."""
+        progress_callback("Burning subtitles...", 50)
+        self.processor.burn_subtitles(
+            video_path,
+            srt_path,
+            **asdict(settings),
+            progress_callback=progress_callback
+        )
+        return "Video processing completed!"
+
+    def burn_batch(self):
+        """Burn each selected video with the SRT file next to it, several at once."""
+        filenames = self._open_files(
+            "Select Videos",
+            "Video files (*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm *.m4v)")
+        if not filenames:
+            return
+
+        jobs = [(video, str(Path(video).with_suffix('.srt'))) for video in filenames]
+
+        self.process_button.setEnabled(False)
+        self.batch_button.setEnabled(False)
+        self.progress_bar.setMaximum(100)
+        self._update_progress(f"Starting batch of {len(jobs)} videos...", 0)
+
+        self._spawn(self._do_batch, jobs, self._burn_settings(), pool=self.job_pool, progress=True,
+                    on_success=self._show_success, on_finished=self._batch_finished)
+
+    def _do_batch(self, jobs: list, settings: BurnSettings, progress_callback) -> str:
+        """Burn a batch of videos (runs on a worker thread)."""
+        missing = [srt for _, srt in jobs if not os.path.isfile(srt)]
+        if missing:
+            raise RuntimeError("No subtitles found for:\n" + "\n".join(missing))
+
+        self.processor.process_batch(jobs, progress_callback=progress_callback,
+                                     **asdict(settings))
+        return f"Burned subtitles into {len(jobs)} videos"
+
+    def _batch_finished(self):
+        """Re-enable the controls after a batch."""
+        self.batch_button.setEnabled(True)
+        self._progress_done()
 
     def start_processing(self):
         """Handles the entire subtitle creation/burning process."""
         # Validate video file selection
-        if not self.video_path.text():
+        if self._video_file is None:
             self._show_error("Please select a video file")
             return
 
+        if not self._video_file.is_file():
+            self._show_error("Selected video file does not exist")
+            return
+
+        # Without an SRT path, write the subtitles next to the video
+        if self._srt_file is None:
+            self.srt_path.setText(str(self._video_file.with_suffix('.srt')))
+
         video_path = self.video_path.text()
         srt_path = self.srt_path.text()
-        model_name = self.model_combo.currentText().split()[0]
+        model_name = self.model_combo.currentData()
 
         # Verify model download status
         if not self.processor.is_model_downloaded(model_name):
@@ -230,7 +421,7 @@ class SubtitleGUI(QMainWindow):
             return
 
         # Check if SRT file already exists
-        if os.path.exists(srt_path):
+        if self._srt_file.is_file():
             reply = QMessageBox.question(
                 self, "SRT File Exists",
                 "SRT file already exists.\n\nUse existing file?",
@@ -245,88 +436,96 @@ class SubtitleGUI(QMainWindow):
                 self.burn_subtitles()
                 return
 
-        def do_process():
-            try:
-                # Phase 1: Create subtitles (0-50% progress)
-                worker.signals.progress.emit("Preparing for subtitle creation...", 0)
-                language = self.language_combo.currentText().split()[0]
-
-                def subtitle_progress(status, value):
-                    # Scale progress from 0-100 to 0-50
-                    scaled_value = value // 2
-                    worker.signals.progress.emit(f"Creating subtitles: {status}", scaled_value)
-
-                # Create subtitles
-                worker.signals.progress.emit("Initializing Whisper model...", 5)
-                self.processor.create_subtitles(
-                    video_path,
-                    srt_path,
-                    model_name,
-                    language,
-                    progress_callback=subtitle_progress
-                )
-
-                # Phase 2: Burn subtitles (50-100% progress)
-                worker.signals.progress.emit("Preparing for subtitle burning...", 50)
-
-                # Burn subtitles phase
-                self.processor.burn_subtitles(
-                    video_path,
-                    srt_path,
-                    font_size=self.font_size.currentText(),
-                    font_name=self.font_name.currentText(),
-                    font_color=self.font_color.currentText(),
-                    font_outline=self.font_outline.currentText(),
-                    video_quality=self.video_quality.currentText(),
-                    video_preset=self.video_preset.currentText(),
-                    background_color=self.background_color.currentText(),
-                    uppercase=self.uppercase_option.isChecked(),
-                    word_by_word=self.word_by_word_option.isChecked(),
-                    progress_callback=burn_progress
-                )
-
-                def burn_progress(status, value):
-                    # Scale progress from 0-100 to 50-100
-                    scaled_value = 50 + (value // 2)
-                    worker.signals.progress.emit(f"Burning subtitles: {status}", scaled_value)
-
-                # Burn subtitles into video
-                self.processor.burn_subtitles(
-                    video_path,
-                    srt_path,
-                    font_size=self.font_size.currentText(),
-                    font_name=self.font_name.currentText(),
-                    font_color=self.font_color.currentText(),
-                    font_outline=self.font_outline.currentText(),
-                    video_quality=self.video_quality.currentText(),
-                    video_preset=self.video_preset.currentText(),
-                    progress_callback=burn_progress
-                )
-
-                # Signal completion
-                worker.signals.progress.emit("Processing completed successfully!", 100)
-                worker.signals.success.emit("Video processing completed successfully!")
-
-            except Exception as e:
-                # Handle any errors during processing
-                error_message = f"Error during processing: {str(e)}"
-                worker.signals.error.emit(error_message)
-                worker.signals.progress.emit("Processing failed", 0)
-
-        # Create and configure worker
-        worker = Worker(do_process)
-        worker.signals.progress.connect(self._update_progress)
-        worker.signals.error.connect(self._show_error)
-        worker.signals.success.connect(self._show_success)
-        worker.signals.finished.connect(lambda: self._update_progress("Ready", 100))
-
-        # Prepare UI for processing
+        # Only one transcription at a time; the button is disabled meanwhile
+        if self._process_thread is not None and self._process_thread.isRunning():
+            return
+
+        # Create and configure the thread
+        thread = TranscribeThread(
+            self._do_process, video_path, srt_path, model_name,
+            self.language_combo.currentData(),
+            self.compute_type.currentText(),
+            self._burn_settings()
+        )
+        queued = Qt.ConnectionType.QueuedConnection
+        thread.progress.connect(self._update_progress, queued)
+        thread.error.connect(self._process_failed, queued)
+        thread.result.connect(self._process_succeeded, queued)
+        self._process_thread = thread
+
+        # Prepare UI for processing; replacing or deleting the model
+        # mid-run would pull it out from under the transcription
+        self._transcribing = True
         self.process_button.setEnabled(False)
+        self.download_button.setEnabled(False)
+        self.remove_button.setEnabled(False)
         self.progress_bar.setMaximum(100)
         self._update_progress("Initializing processing...", 0)
 
         # Start processing in background
-        self.threadpool.start(worker)
+        thread.start()
+
+    def _do_process(self, video_path: str, srt_path: str, model_name: str, language: str,
+                    compute_type: str, settings: BurnSettings, progress_callback) -> str:
+        """Create subtitles and burn them in (runs on the transcription thread)."""
+        def subtitle_progress(status: str, value: int):
+            # Scale subtitle creation progress from 0-100 to 0-50
+            progress_callback(f"Creating subtitles: {status}", value // 2)
+
+        def burn_progress(status: str, value: int):
+            # Scale burning progress from 0-100 to 50-100
+            progress_callback(f"Burning subtitles: {status}", 50 + (value // 2))
+
+        try:
+            # Phase 1: Create subtitles (0-50% progress)
+            progress_callback("Preparing for subtitle creation...", 0)
+
+            # Both phases scale their progress by the same duration
+            duration = self.processor.probe_duration(video_path)
+
+            # Create subtitles
+            progress_callback("Initializing Whisper model...", 5)
+            self.processor.create_subtitles(
+                video_path,
+                srt_path,
+                model_name,
+                language,
+                compute_type=compute_type,
+                duration=duration,
+                progress_callback=subtitle_progress
+            )
+
+            # Phase 2: Burn subtitles (50-100% progress)
+            progress_callback("Preparing for subtitle burning...", 50)
+
+            # Burn subtitles into video
+            self.processor.burn_subtitles(
+                video_path,
+                srt_path,
+                **asdict(settings),
+                duration=duration,
+                progress_callback=burn_progress
+            )
+
+            # Signal completion
+            progress_callback("Processing completed successfully!", 100)
+            return "Video processing completed successfully!"
+
+        except Exception as e:
+            # Handle any errors during processing
+            raise RuntimeError(f"Error during processing: {str(e)}") from e
+
+    def _process_succeeded(self, message: str):
+        """Fill the bar and report a finished full run."""
+        self._transcribing = False
+        self._progress_done()
+        self._show_success(message)
+
+    def _process_failed(self, message: str):
+        """Reset the bar and report a failed full run."""
+        self._transcribing = False
+        self._update_progress("Processing failed", 0)
+        self._show_error(message)
 
     def closeEvent(self, event):
         """Manages application shutdown."""
@@ -334,6 +533,9 @@ class SubtitleGUI(QMainWindow):
             self.save_current_settings()
             # Wait for all threads to complete
             self.threadpool.waitForDone()
+            self.job_pool.waitForDone()
+            if self._process_thread is not None:
+                self._process_thread.wait()
             event.accept()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error during shutdown: {str(e)}")
@@ -349,11 +551,33 @@ class SubtitleGUI(QMainWindow):
         # Create UI sections
         main_layout.addWidget(self.create_file_section())
         main_layout.addWidget(self.create_model_section())
-        main_layout.addWidget(self.create_font_section())
+        self.font_group = self.create_font_section()
+        main_layout.addWidget(self.font_group)
         main_layout.addWidget(self.create_translation_section())
         main_layout.addWidget(self.create_video_section())
         main_layout.addWidget(self.create_control_section())
-        main_layout.addWidget(self.create_progress_section())
+        self.progress_group = self.create_progress_section()
+        main_layout.addWidget(self.progress_group)
+
+        # Combos were filled with signals blocked; sync dependent widgets once
+        self.update_model_status()
+
+        # Model sizes come from a local cache; refresh them once the window is up
+        QTimer.singleShot(0, self._refresh_model_sizes)
+
+    @staticmethod
+    def _fill(combo: QComboBox, items, data=None):
+        """Add all items to a combo at once without firing change signals.
+
+        data, if given, is stored per item and returned by currentData().
+        """
+        combo.blockSignals(True)
+        start = combo.count()
+        combo.insertItems(start, items)
+        if data is not None:
+            for i, value in enumerate(data, start):
+                combo.setItemData(i, value)
+        combo.blockSignals(False)
 
     def create_file_section(self) -> QGroupBox:
         """Create the section for file selection."""
@@ -362,6 +586,7 @@ class SubtitleGUI(QMainWindow):
 
         # Video selection
         self.video_path = QLineEdit()
+        self.video_path.textChanged.connect(self._set_video_file)
         video_browse = QPushButton("Browse")
         video_browse.clicked.connect(self.select_video)
         layout.addWidget(QLabel("Video:"), 0, 0)
@@ -370,6 +595,7 @@ class SubtitleGUI(QMainWindow):
 
         # SRT selection
         self.srt_path = QLineEdit()
+        self.srt_path.textChanged.connect(self._set_srt_file)
         srt_browse = QPushButton("Browse")
         srt_browse.clicked.connect(self.select_srt)
         layout.addWidget(QLabel("SRT:"), 1, 0)
@@ -379,6 +605,14 @@ class SubtitleGUI(QMainWindow):
         group.setLayout(layout)
         return group
 
+    def _set_video_file(self, text: str):
+        """Keep the Path for the video field in step with its text."""
+        self._video_file = Path(text) if text else None
+
+    def _set_srt_file(self, text: str):
+        """Keep the Path for the SRT field in step with its text."""
+        self._srt_file = Path(text) if text else None
+
     def create_model_section(self) -> QGroupBox:
         """Create the Whisper model settings section."""
         group = QGroupBox("Whisper Model Settings")
@@ -386,12 +620,11 @@ class SubtitleGUI(QMainWindow):
 
         # Model selection
         self.model_combo = QComboBox()
-        models = list(ModelInfo.SIZES.keys())
-        model_infos = [ModelInfo.get_model_info(m) for m in models]
-        self.model_combo.addItems(model_infos)
-        self.model_combo.currentIndexChanged.connect(self._update_ui)
+        self._fill(self.model_combo, _MODEL_INFO_STRINGS, _MODEL_NAMES)
+        self.model_combo.currentIndexChanged.connect(self._schedule_ui_update)
 
         # Model status and download
+        self._build_missing_labels()
         self.model_status = QLabel("Not downloaded")
         self.download_button = QPushButton("Download Model")
         self.download_button.clicked.connect(self.download_model)
@@ -401,13 +634,22 @@ class SubtitleGUI(QMainWindow):
         layout.addWidget(self.model_status, 0, 2)
         layout.addWidget(self.download_button, 0, 3)
 
+        self.remove_button = QPushButton("Remove")
+        self.remove_button.clicked.connect(self.remove_model)
+        layout.addWidget(self.remove_button, 0, 4)
+
         # Language selection
         self.language_combo = QComboBox()
-        languages = [(code, name) for code, name in ModelInfo.LANGUAGES.items()]
-        self.language_combo.addItems([f"{code} - {name}" for code, name in languages])
+        self._fill(self.language_combo, _LANG_STRINGS, _LANG_CODES)
         layout.addWidget(QLabel("Language:"), 1, 0)
         layout.addWidget(self.language_combo, 1, 1)
 
+        # Inference precision (speed vs. quality)
+        self.compute_type = QComboBox()
+        self._fill(self.compute_type, _COMPUTE_TYPES)
+        layout.addWidget(QLabel("Precision:"), 1, 2)
+        layout.addWidget(self.compute_type, 1, 3)
+
         # Progress bar
         self.download_progress = QProgressBar()
         layout.addWidget(self.download_progress, 2, 0, 1, 4)
@@ -422,31 +664,31 @@ class SubtitleGUI(QMainWindow):
 
         # Font size
         self.font_size = QComboBox()
-        self.font_size.addItems(["16", "20", "24", "28", "32", "36", "40", "48"])
+        self._fill(self.font_size, _FONT_SIZES)
         layout.addWidget(QLabel("Size:"), 0, 0)
         layout.addWidget(self.font_size, 0, 1)
 
         # Font family
         self.font_name = QComboBox()
-        self.font_name.addItems(["Arial", "Times New Roman", "Helvetica", "Courier"])
+        self._fill(self.font_name, _FONT_NAMES)
         layout.addWidget(QLabel("Font:"), 0, 2)
         layout.addWidget(self.font_name, 0, 3)
 
         # Font color
         self.font_color = QComboBox()
-        self.font_color.addItems(["white", "yellow", "green", "cyan"])
+        self._fill(self.font_color, _FONT_COLORS)
         layout.addWidget(QLabel("Color:"), 1, 0)
         layout.addWidget(self.font_color, 1, 1)
 
         # Outline color
         self.font_outline = QComboBox()
-        self.font_outline.addItems(["black", "white", "none"])
+        self._fill(self.font_outline, _OUTLINE_COLORS)
         layout.addWidget(QLabel("Outline:"), 1, 2)
         layout.addWidget(self.font_outline, 1, 3)
 
         # Background color
         self.background_color = QComboBox()
-        self.background_color.addItems(["none", "black", "white", "gray"])
+        self._fill(self.background_color, _BACKGROUND_COLORS)
         layout.addWidget(QLabel("Background:"), 2, 0)
         layout.addWidget(self.background_color, 2, 1)
 
@@ -460,7 +702,7 @@ class SubtitleGUI(QMainWindow):
 
         # Subtitle position
         self.subtitle_position = QComboBox()
-        self.subtitle_position.addItems(["bottom", "top center"])
+        self._fill(self.subtitle_position, _POSITIONS)
         layout.addWidget(QLabel("Position:"), 3, 0)
         layout.addWidget(self.subtitle_position, 3, 1)
 
@@ -490,25 +732,82 @@ class SubtitleGUI(QMainWindow):
         layout = QGridLayout()
 
         # From language
+        # Filled by _populate_languages once the window is up
         self.trans_from = QComboBox()
-        self.trans_from.addItems(self.processor.translator.get_supported_languages())
+        self.trans_from.addItem("Loading...")
+        self.trans_from.setEnabled(False)
         layout.addWidget(QLabel("From:"), 0, 0)
         layout.addWidget(self.trans_from, 0, 1)
 
         # To language
         self.trans_to = QComboBox()
-        self.trans_to.addItems(self.processor.translator.get_supported_languages())
+        self.trans_to.addItem("Loading...")
+        self.trans_to.setEnabled(False)
         layout.addWidget(QLabel("To:"), 0, 2)
         layout.addWidget(self.trans_to, 0, 3)
 
-        # Translate button
-        translate_button = QPushButton("Translate SRT")
-        translate_button.clicked.connect(self.translate_srt)
-        layout.addWidget(translate_button, 1, 0, 1, 4)
+        # Translate button; waits for the language list, and retries its
+        # fetch if that failed
+        self._languages_loaded = False
+        self.translate_button = QPushButton("Loading languages...")
+        self.translate_button.setEnabled(False)
+        self.translate_button.clicked.connect(self.translate_srt)
+        layout.addWidget(self.translate_button, 1, 0, 1, 4)
 
         group.setLayout(layout)
+        QTimer.singleShot(0, self._populate_languages)
         return group
 
+    def _refresh_model_sizes(self):
+        """Revalidate the model download sizes in the background."""
+        self._spawn(ModelInfo.refresh_sizes, on_result=self._apply_model_sizes)
+
+    def _apply_model_sizes(self, sizes: dict):
+        """Take in re-measured sizes on the GUI thread and relabel the models."""
+        ModelInfo._apply_sizes(sizes)
+        self._update_model_labels()
+
+    def _build_missing_labels(self):
+        """Precompute the status text shown for each model that is not downloaded."""
+        self._missing_labels = {name: f"Not downloaded ({info['size_str']})"
+                                for name, info in ModelInfo.SIZES.items()}
+
+    def _update_model_labels(self):
+        """Rewrite the model combo entries after the sizes changed."""
+        self._build_missing_labels()
+        for idx, (model_name, info) in enumerate(ModelInfo.SIZES.items()):
+            self.model_combo.setItemText(idx, ModelInfo.format_info(model_name, info))
+        self.update_model_status()
+
+    def _populate_languages(self):
+        """Fetch the translator's languages in the background."""
+        self.translate_button.setEnabled(False)
+        self.translate_button.setText("Loading languages...")
+        self.translate_button.setToolTip("")
+        self._spawn(lambda: list(self.processor.translator.get_supported_languages()),
+                    on_result=self._set_languages, on_error=self._languages_failed)
+
+    def _languages_failed(self, message: str):
+        """Offer to retry when the language list could not be fetched."""
+        for combo in (self.trans_from, self.trans_to):
+            combo.setItemText(0, "Unavailable")
+        self.translate_button.setText("Retry loading languages")
+        self.translate_button.setToolTip(message)
+        self.translate_button.setEnabled(True)
+
+    def _set_languages(self, languages):
+        """Fill the translation combos once the language list is known."""
+        # Both combos show the same list, so they share one model
+        model = QStringListModel(languages, self)
+        for combo in (self.trans_from, self.trans_to):
+            combo.blockSignals(True)
+            combo.setModel(model)
+            combo.blockSignals(False)
+            combo.setEnabled(True)
+        self._languages_loaded = True
+        self.translate_button.setText("Translate SRT")
+        self.translate_button.setEnabled(True)
+
     def create_video_section(self) -> QGroupBox:
         """Create the section for video settings."""
         group = QGroupBox("Video Settings")
@@ -516,20 +815,68 @@ class SubtitleGUI(QMainWindow):
 
         # Quality (CRF)
         self.video_quality = QComboBox()
-        self.video_quality.addItems(["18", "23", "28"])
+        self._fill(self.video_quality, _QUALITIES)
+        self.video_quality.setCurrentText("23")
         layout.addWidget(QLabel("Quality:"), 0, 0)
         layout.addWidget(self.video_quality, 0, 1)
 
         # Encoding preset
         self.video_preset = QComboBox()
-        self.video_preset.addItems(["ultrafast", "superfast", "veryfast", "faster",
-                                  "fast", "medium", "slow"])
+        self._fill(self.video_preset, _PRESETS)
         layout.addWidget(QLabel("Preset:"), 0, 2)
         layout.addWidget(self.video_preset, 0, 3)
 
+        # Video encoder (hardware encoders found by the processor's probe)
+        self.video_encoder = QComboBox()
+        self._fill(self.video_encoder, ["auto"] + self.processor.available_video_encoders)
+        layout.addWidget(QLabel("Encoder:"), 1, 0)
+        layout.addWidget(self.video_encoder, 1, 1)
+
+        # x264 tuning hint
+        self.video_tune = QComboBox()
+        self._fill(self.video_tune, _TUNES)
+        layout.addWidget(QLabel("Tune:"), 1, 2)
+        layout.addWidget(self.video_tune, 1, 3)
+
+        # Streaming-friendly MP4 layout
+        self.faststart_option = QCheckBox("Web-optimized (+faststart)")
+        self.faststart_option.setChecked(True)
+        layout.addWidget(self.faststart_option, 2, 0, 1, 2)
+
+        # Encoder threads; 0 leaves the choice to ffmpeg (all cores)
+        self.video_threads = QSpinBox()
+        self.video_threads.setRange(0, os.cpu_count() or 1)
+        self.video_threads.setSpecialValueText("auto")
+        layout.addWidget(QLabel("Threads:"), 2, 2)
+        layout.addWidget(self.video_threads, 2, 3)
+
+        # Keep the encoder off the core the UI runs on
+        self.spare_core_option = QCheckBox("Keep one CPU core free for the interface")
+        layout.addWidget(self.spare_core_option, 3, 0, 1, 2)
+
+        # GPU video decoding
+        self.hw_decode_option = QCheckBox("Hardware decoding")
+        layout.addWidget(self.hw_decode_option, 3, 2, 1, 2)
+
+        # Hard burn re-encodes the video; soft subtitles are only muxed in
+        self.hard_burn_option = QRadioButton("Hard burn")
+        self.hard_burn_option.setChecked(True)
+        self.soft_subs_option = QRadioButton("Soft subtitle track (no re-encode)")
+        self.soft_subs_option.toggled.connect(self._update_subtitle_mode)
+        layout.addWidget(self.hard_burn_option, 4, 0, 1, 2)
+        layout.addWidget(self.soft_subs_option, 4, 2, 1, 2)
+
         group.setLayout(layout)
         return group
 
+    def _update_subtitle_mode(self, soft: bool):
+        """Disable the settings that only apply when re-encoding."""
+        self.font_group.setEnabled(not soft)
+        for widget in (self.video_quality, self.video_preset, self.video_encoder,
+                       self.video_tune, self.video_threads, self.spare_core_option,
+                       self.hw_decode_option):
+            widget.setEnabled(not soft)
+
     def create_control_section(self) -> QWidget:
         """Create the controls section."""
         widget = QWidget()
@@ -539,6 +886,10 @@ class SubtitleGUI(QMainWindow):
         self.process_button.clicked.connect(self.start_processing)
         layout.addWidget(self.process_button)
 
+        self.batch_button = QPushButton("Burn batch...")
+        self.batch_button.clicked.connect(self.burn_batch)
+        layout.addWidget(self.batch_button)
+
         widget.setLayout(layout)
         return widget
 
@@ -556,95 +907,153 @@ class SubtitleGUI(QMainWindow):
         group.setLayout(layout)
         return group
 
+    def _open_file(self, caption: str, file_filter: str) -> str:
+        """Show the native open dialog, starting in the last used directory."""
+        url, _ = QFileDialog.getOpenFileUrl(
+            self, caption, QUrl.fromLocalFile(self._last_dir), file_filter,
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.ReadOnly)
+        filename = url.toLocalFile()
+        if filename:
+            self._last_dir = os.path.dirname(filename)
+        return filename
+
+    def _open_files(self, caption: str, file_filter: str) -> list:
+        """Like _open_file, but lets the user pick several files."""
+        urls, _ = QFileDialog.getOpenFileUrls(
+            self, caption, QUrl.fromLocalFile(self._last_dir), file_filter,
+            options=QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.ReadOnly)
+        filenames = [url.toLocalFile() for url in urls]
+        if filenames:
+            self._last_dir = os.path.dirname(filenames[0])
+        return filenames
+
     def select_video(self):
         """Manages video file selection."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Select Video File", "",
+        filename = self._open_file(
+            "Select Video File",
             "Video files (*.mp4 *.avi *.mkv *.mov *.wmv *.flv *.webm *.m4v)")
         if filename:
             self.video_path.setText(filename)
+            # Warm up the model while the user finishes the other settings;
+            # the cache check stays off the GUI thread
+            self._spawn(self.processor.preload_model, self.model_combo.currentData(),
+                        self.compute_type.currentText(), on_error=self._preload_failed)
             if not self.srt_path.text():
-                srt_path = str(Path(filename).with_suffix('.srt'))
-                self.srt_path.setText(srt_path)
+                self.srt_path.setText(str(self._video_file.with_suffix('.srt')))
 
     def select_srt(self):
         """Manages SRT file selection."""
-        filename, _ = QFileDialog.getOpenFileName(
-            self, "Select Subtitle File", "",
-            "Subtitle files (*.srt *.ass *.ssa)")
+        filename = self._open_file("Select Subtitle File", "Subtitle files (*.srt *.ass *.ssa)")
         if filename:
             self.srt_path.setText(filename)
 
     def update_model_status(self):
         """Update the status of the selected model."""
-        selected = self.model_combo.currentText().split()[0]
-        if self.processor.is_model_downloaded(selected):
+        selected = self.model_combo.currentData()
+        downloaded = self.processor.is_model_downloaded(selected)
+        if downloaded:
             self.model_status.setText("Downloaded")
-            self.download_button.setEnabled(False)
         else:
-            size = humanize.naturalsize(ModelInfo.SIZES[selected]['size'])
-            self.model_status.setText(f"Not downloaded ({size})")
-            self.download_button.setEnabled(True)
+            self.model_status.setText(self._missing_labels[selected])
+        self.download_button.setEnabled(not downloaded and not self._transcribing)
+        self.remove_button.setEnabled(downloaded and not self._transcribing)
 
     def load_saved_settings(self):
-        """Load saved settings."""
-        try:
-            settings = self.processor.load_settings()
+        """Read saved settings in the background and apply them when ready."""
+        self._spawn(self.processor.load_settings, on_result=self._apply_loaded_settings,
+                    on_error=self._settings_load_failed)
+
+    def _settings_load_failed(self, message: str):
+        """Report a settings file that could not be read."""
+        self._show_error(f"Error loading settings: {message}")
 
+    def _apply_loaded_settings(self, settings: AppSettings):
+        """Apply loaded settings to the widgets."""
+        try:
             # Set values in widgets
-            self.font_size.setCurrentText(settings.get('font_size', "24"))
-            self.font_name.setCurrentText(settings.get('font_name', "Arial"))
-            self.font_color.setCurrentText(settings.get('font_color', "white"))
-            self.font_outline.setCurrentText(settings.get('font_outline', "black"))
-            self.background_color.setCurrentText(settings.get('background_color', "none"))
-            self.uppercase_option.setChecked(settings.get('uppercase', False))
-            self.word_by_word_option.setChecked(settings.get('word_by_word', False))
-            self.subtitle_position.setCurrentText(settings.get('subtitle_position', "bottom"))
-            self.video_quality.setCurrentText(settings.get('video_quality', "23"))
-            self.video_preset.setCurrentText(settings.get('video_preset', "medium"))
+            self.font_size.setCurrentText(settings.font_size)
+            self.font_name.setCurrentText(settings.font_name)
+            self.font_color.setCurrentText(settings.font_color)
+            self.font_outline.setCurrentText(settings.font_outline)
+            self.background_color.setCurrentText(settings.background_color)
+            self.uppercase_option.setChecked(settings.uppercase)
+            self.word_by_word_option.setChecked(settings.word_by_word)
+            self.subtitle_position.setCurrentText(settings.subtitle_position)
+            self.video_quality.setCurrentText(settings.video_quality)
+            self.video_preset.setCurrentText(settings.video_preset)
+            self.video_encoder.setCurrentText(settings.video_encoder)
+            self.video_tune.setCurrentText(settings.video_tune)
+            self.faststart_option.setChecked(settings.faststart)
+            self.video_threads.setValue(settings.video_threads)
+            self.spare_core_option.setChecked(settings.spare_core)
+            self.soft_subs_option.setChecked(settings.soft_subtitles)
+            self.hw_decode_option.setChecked(settings.hw_decode)
+            self.compute_type.setCurrentText(settings.compute_type)
 
             # Set MarginL value
-            margin_left = settings.get('margin_left', 200)  # Default to 200
-            self.margin_slider.setValue(margin_left)
-            self.margin_label.setText(f"MarginL: {margin_left}")
+            self.margin_slider.setValue(settings.margin_left)
+            self.margin_label.setText(f"MarginL: {settings.margin_left}")
+
+            # Open dialogs where the last session left off
+            if settings.last_dir and os.path.isdir(settings.last_dir):
+                self._last_dir = settings.last_dir
 
             # Set model and language
-            model_name = settings.get('whisper_model', "base")
-            for i in range(self.model_combo.count()):
-                if self.model_combo.itemText(i).startswith(model_name):
-                    self.model_combo.setCurrentIndex(i)
-                    break
-
-            language = settings.get('whisper_language', "auto")
-            for i in range(self.language_combo.count()):
-                if self.language_combo.itemText(i).startswith(language):
-                    self.language_combo.setCurrentIndex(i)
-                    break
+            idx = _MODEL_INDEX.get(settings.whisper_model)
+            if idx is not None:
+                self.model_combo.setCurrentIndex(idx)
+                # Pre-warm the last used model if it is already on disk; the
+                # cache check stays off the GUI thread
+                self._spawn(self.processor.preload_model, settings.whisper_model,
+                            settings.compute_type, on_error=self._preload_failed)
+
+            idx = _LANG_INDEX.get(settings.whisper_language)
+            if idx is not None:
+                self.language_combo.setCurrentIndex(idx)
 
         except Exception as e:
             self._show_error(f"Error loading settings: {str(e)}")
 
 
+    def _preload_failed(self, message: str):
+        """A failed pre-warm only costs speed; the model loads again when needed."""
+        self.processor.logger.warning(f"Could not pre-load model: {message}")
+
     def save_current_settings(self):
         """Save the current settings."""
         try:
-            settings = {
-                'font_size': self.font_size.currentText(),
-                'font_name': self.font_name.currentText(),
-                'font_color': self.font_color.currentText(),
-                'font_outline': self.font_outline.currentText(),
-                'background_color': self.background_color.currentText(),
-                'uppercase': self.uppercase_option.isChecked(),
-                'word_by_word': self.word_by_word_option.isChecked(),
-                'whisper_model': self.model_combo.currentText().split()[0],
-                'whisper_language': self.language_combo.currentText().split()[0],
-                'video_quality': self.video_quality.currentText(),
-                'video_preset': self.video_preset.currentText(),
-                'subtitle_position': self.subtitle_position.currentText(),
-                'margin_left': self.margin_slider.value()
-            }
-
-            self.processor.save_settings(settings)
+            settings = AppSettings(
+                font_size=self.font_size.currentText(),
+                font_name=self.font_name.currentText(),
+                font_color=self.font_color.currentText(),
+                font_outline=self.font_outline.currentText(),
+                background_color=self.background_color.currentText(),
+                uppercase=self.uppercase_option.isChecked(),
+                word_by_word=self.word_by_word_option.isChecked(),
+                whisper_model=self.model_combo.currentData(),
+                whisper_language=self.language_combo.currentData(),
+                compute_type=self.compute_type.currentText(),
+                video_quality=self.video_quality.currentText(),
+                video_preset=self.video_preset.currentText(),
+                video_encoder=self.video_encoder.currentText(),
+                video_tune=self.video_tune.currentText(),
+                faststart=self.faststart_option.isChecked(),
+                video_threads=self.video_threads.value(),
+                spare_core=self.spare_core_option.isChecked(),
+                soft_subtitles=self.soft_subs_option.isChecked(),
+                hw_decode=self.hw_decode_option.isChecked(),
+                subtitle_position=self.subtitle_position.currentText(),
+                margin_left=self.margin_slider.value(),
+                last_dir=self._last_dir
+            )
+
+            # Widgets are read here; only the file write leaves the GUI thread
+            self._spawn(self.processor.save_settings, settings,
+                        on_error=self._settings_save_failed)
 
         except Exception as e:
             self._show_error(f"Error saving settings: {str(e)}")
+
+    def _settings_save_failed(self, message: str):
+        """Report a settings file that could not be written."""
+        self._show_error(f"Error saving settings: {message}")
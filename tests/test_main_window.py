@@ -0,0 +1,49 @@
+# tests/test_main_window.py
+
+import importlib.util
+import unittest
+from types import SimpleNamespace
+
+HAS_GUI_DEPS = all(importlib.util.find_spec(name) is not None for name in ('PyQt6', 'numpy'))
+
+if HAS_GUI_DEPS:
+    from core.settings import BurnSettings
+    from gui.main_window import SubtitleGUI
+
+
+class FakeProcessor:
+    """Records the processor calls a full run makes, without running ffmpeg or Whisper."""
+
+    def __init__(self):
+        self.calls = []
+
+    def probe_duration(self, video_path):
+        self.calls.append('probe_duration')
+        return 60.0
+
+    def create_subtitles(self, video_path, srt_path, model_name, language, **kwargs):
+        self.calls.append('create_subtitles')
+        kwargs['progress_callback']("Transcribing", 100)
+
+    def burn_subtitles(self, video_path, srt_path, **kwargs):
+        self.calls.append('burn_subtitles')
+        kwargs['progress_callback']("Encoding", 100)
+
+
+@unittest.skipUnless(HAS_GUI_DEPS, "PyQt6 and numpy are not installed")
+class FullRunTest(unittest.TestCase):
+    def test_full_run_burns_once(self):
+        processor = FakeProcessor()
+        progress = []
+        message = SubtitleGUI._do_process(SimpleNamespace(processor=processor),
+                                          "in.mp4", "in.srt", "base", "auto", "auto",
+                                          BurnSettings(), lambda status, value: progress.append(value))
+        self.assertEqual(processor.calls.count('burn_subtitles'), 1)
+        self.assertEqual(processor.calls, ['probe_duration', 'create_subtitles', 'burn_subtitles'])
+        self.assertEqual(progress[-1], 100)
+        self.assertEqual(progress, sorted(progress))
+        self.assertEqual(message, "Video processing completed successfully!")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+# tests/test_processor.py
+
+import ast
+import importlib.util
+import unittest
+from pathlib import Path
+
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+if HAS_NUMPY:
+    from core.processor import SubtitleProcessor
+
+PROCESSOR_SOURCE = Path(__file__).resolve().parent.parent / 'core' / 'processor.py'
+
+
+class ProcessorDefinitionTest(unittest.TestCase):
+    def test_subtitle_processor_is_defined_once(self):
+        tree = ast.parse(PROCESSOR_SOURCE.read_text(encoding='utf-8'))
+        classes = [node.name for node in tree.body if isinstance(node, ast.ClassDef)]
+        self.assertEqual(classes.count('SubtitleProcessor'), 1)
+
+    @unittest.skipUnless(HAS_NUMPY, "numpy is not installed")
+    def test_colors_of_the_kept_definition(self):
+        self.assertEqual(SubtitleProcessor.convert_color_to_hex('gray'), '&H808080&')
+        self.assertEqual(SubtitleProcessor.convert_color_to_hex('none'), '')
+        self.assertEqual(SubtitleProcessor.convert_color_to_hex('unknown'), '&HFFFFFF&')
+
+
+if __name__ == "__main__":
+    unittest.main()
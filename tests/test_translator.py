@@ -0,0 +1,46 @@
+# tests/test_translator.py
+
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+
+HAS_DEEP_TRANSLATOR = importlib.util.find_spec('deep_translator') is not None
+
+if HAS_DEEP_TRANSLATOR:
+    from utils.translator import _CUE, SubtitleTranslator
+
+TIMING = "00:00:05,000 --> 00:00:06,000"
+
+
+@unittest.skipUnless(HAS_DEEP_TRANSLATOR, "deep_translator is not installed")
+class CueParsingTest(unittest.TestCase):
+    def test_empty_cue_does_not_swallow_the_next_one(self):
+        content = f"2\n{TIMING}\n\n\n3\n{TIMING}\nC"
+        self.assertEqual(_CUE.findall(content), [("2", TIMING, ""), ("3", TIMING, "C")])
+
+    def test_block_without_timing_line_is_skipped(self):
+        content = f"1\nnot a timing line\nA\n\n2\n{TIMING}\nB\nC\n"
+        self.assertEqual(_CUE.findall(content), [("2", TIMING, "B\nC")])
+
+    def test_empty_cue_is_written_back_and_not_sent(self):
+        sent = []
+
+        def fake_translate(texts, from_lang, to_lang):
+            sent.extend(texts)
+            return [text.upper() for text in texts]
+
+        translator = SubtitleTranslator(cache_path=None)
+        translator._translate_texts = fake_translate
+        with tempfile.TemporaryDirectory() as tmp:
+            source, output = Path(tmp) / "in.srt", Path(tmp) / "out.srt"
+            source.write_text(f"1\n{TIMING}\nA\n\n2\n{TIMING}\n\n\n3\n{TIMING}\nC\n",
+                              encoding='utf-8')
+            translator.translate_srt(str(source), str(output), "en", "fr")
+            self.assertEqual(output.read_text(encoding='utf-8'),
+                             f"1\n{TIMING}\nA\n\n2\n{TIMING}\n\n\n3\n{TIMING}\nC\n\n")
+        self.assertEqual(sent, ["A", "C"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,46 +1,201 @@
 # translator.py
 from deep_translator import GoogleTranslator
+from deep_translator.exceptions import RequestError, TooManyRequests
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from pathlib import Path
+import hashlib
+import random
 import re
+import sqlite3
+import threading
+import time
+
+# One SRT cue: number line, timing line, then text up to the next blank line
+# (empty for a cue with no text); blocks without a well-formed timing line
+# are skipped
+_TIMING = r'\d+:\d\d:\d\d[,.]\d{3} --> \d+:\d\d:\d\d[,.]\d{3}[^\n]*'
+_CUE = re.compile(rf'^\ufeff?(\d+)[ \t]*\n({_TIMING})(?:\n([^\n].*?))?(?=\n[ \t]*\n|\n?\Z)',
+                  re.MULTILINE | re.DOTALL)
+
+# Line breaks inside a cue travel as a private-use character Google leaves
+# alone, and are restored afterwards
+_LINE_BREAK = " \ue000 "
+_LINE_BREAK_RESTORE = re.compile(r'[ \t]*\ue000[ \t]*')
+
+# Cue texts are joined with this marker so one request carries many cues;
+# Google may rewrap the whitespace around it, so splitting is lenient
+_SEPARATOR = "\n@@@@@\n"
+_SEPARATOR_SPLIT = re.compile(r'\s*@@@@@\s*')
+
+# Google's web endpoint rejects requests over 5000 characters
+_MAX_REQUEST_CHARS = 4500
+
+# Rate limiting and dropped connections are retried with exponential backoff
+_RETRYABLE = (RequestError, TooManyRequests, OSError)
+_RETRIES = 4
+_BACKOFF_SECONDS = 0.5
+
+# Translations already fetched, reused across runs
+_CACHE_PATH = Path.home() / '.cache' / 'subtitle-creator' / 'translations.sqlite3'
+
+def _cache_key(from_lang: str, to_lang: str, text: str) -> bytes:
+    """Return the cache row key for one cue text in one language pair."""
+    return hashlib.blake2b(f"{from_lang}\0{to_lang}\0{text}".encode('utf-8'),
+                           digest_size=16).digest()
+
+def _with_retry(fn, *args):
+    """Call fn(*args), retrying transient request failures."""
+    for attempt in range(_RETRIES):
+        try:
+            return fn(*args)
+        except _RETRYABLE:
+            if attempt == _RETRIES - 1:
+                raise
+            # Jitter keeps the pool threads from retrying in lockstep
+            time.sleep(_BACKOFF_SECONDS * 2 ** attempt * random.uniform(0.5, 1.5))
+
+@lru_cache(maxsize=1)
+def _supported_languages() -> tuple:
+    """Google's language list, fetched once per process."""
+    return tuple(GoogleTranslator().get_supported_languages())
+
+class TranslationError(Exception):
+    """Raised when an SRT file cannot be translated; the cause is chained."""
 
 class SubtitleTranslator:
-    def __init__(self):
-        self.supported_languages = GoogleTranslator().get_supported_languages()
+    def __init__(self, max_workers: int = 8, cache_path: Path = _CACHE_PATH):
+        self.max_workers = max_workers
+        # None keeps the cache in memory only
+        self.cache_path = cache_path
+        self._cache = {}
+        # GoogleTranslator keeps the query in its own state, so every pool
+        # thread builds its own instances; they are reused across files
+        self._local = threading.local()
+
+    @cached_property
+    def _pool(self) -> ThreadPoolExecutor:
+        """Request threads, started on the first translation and kept for the next."""
+        return ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='translate')
+
+    def _translator(self, from_lang: str, to_lang: str) -> GoogleTranslator:
+        """Return this thread's translator for a language pair, building it once."""
+        translators = getattr(self._local, 'translators', None)
+        if translators is None:
+            translators = self._local.translators = {}
+        key = (from_lang, to_lang)
+        if key not in translators:
+            translators[key] = GoogleTranslator(source=from_lang, target=to_lang)
+        return translators[key]
 
     def translate_srt(self, input_file: str, output_file: str, from_lang: str, to_lang: str) -> None:
         """Translates an SRT file from one language to another."""
+        return self.translate_srt_many([(input_file, output_file)], from_lang, to_lang)
+
+    def translate_srt_many(self, jobs: list, from_lang: str, to_lang: str) -> None:
+        """Translates several (input_file, output_file) SRT pairs in one go.
+
+        Cues from every file share request batches, the cache and the
+        request threads, so repeated lines across files are sent once.
+        """
         try:
-            translator = GoogleTranslator(source=from_lang, target=to_lang)
-
-            with open(input_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # divide the content into blocks (each subtitle is a block)
-            blocks = content.strip().split('\n\n')
-            translated_blocks = []
-
-            for block in blocks:
-                lines = block.split('\n')
-                if len(lines) >= 3:
-                    # Keep the subtitle number
-                    number = lines[0]
-                    # Keep the timestamp
-                    timestamp = lines[1]
-                    # Merge and translate text
-                    text = ' '.join(lines[2:])
-                    translated_text = translator.translate(text)
-
-                    # Recreate the block
-                    translated_block = f"{number}\n{timestamp}\n{translated_text}\n"
-                    translated_blocks.append(translated_block)
-
-            # Save the translated file
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(translated_blocks))
+            # Pull (number, timestamp, text) out of every cue in one pass
+            files = [(output_file, _CUE.findall(Path(input_file).read_text(encoding='utf-8')))
+                     for input_file, output_file in jobs]
+            # Cues with no text are written back as they are, never sent
+            texts = [text.replace('\n', _LINE_BREAK)
+                     for _, cues in files for _, _, text in cues if text]
+
+            translated_texts = iter([_LINE_BREAK_RESTORE.sub('\n', text) if text else text
+                                     for text in self._translate_cached(texts, from_lang, to_lang)])
+
+            # Recreate the cues and save the translated files
+            for output_file, cues in files:
+                with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.writelines(f"{number}\n{timestamp}\n{next(translated_texts) if text else text}\n\n"
+                                 for number, timestamp, text in cues)
 
             return True
 
         except Exception as e:
-            raise Exception(f"Error translating subtitles: {str(e)}")
+            raise TranslationError(f"Error translating subtitles: {str(e)}") from e
+
+    def _open_cache(self):
+        """Open the on-disk translation cache, or return None if it is disabled or unusable."""
+        if self.cache_path is None:
+            return None
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.cache_path)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('CREATE TABLE IF NOT EXISTS translations (hash BLOB PRIMARY KEY, text TEXT)')
+            return db
+        except (OSError, sqlite3.Error):
+            return None
+
+    def _translate_cached(self, texts: list, from_lang: str, to_lang: str) -> list:
+        """Translate cue texts, only sending the ones not translated before."""
+        keys = [_cache_key(from_lang, to_lang, text) for text in texts]
+        db = self._open_cache()
+        try:
+            if db is not None:
+                for key in dict.fromkeys(keys):
+                    if key not in self._cache:
+                        row = db.execute('SELECT text FROM translations WHERE hash = ?',
+                                         (key,)).fetchone()
+                        if row is not None:
+                            self._cache[key] = row[0]
+
+            # Repeated cues within the file are sent once
+            missing = {key: text for key, text in zip(keys, texts) if key not in self._cache}
+            if missing:
+                translated = self._translate_texts(list(missing.values()), from_lang, to_lang)
+                rows = [(key, text) for key, text in zip(missing, translated) if text is not None]
+                self._cache.update(rows)
+                if db is not None:
+                    try:
+                        with db:
+                            db.executemany('INSERT OR REPLACE INTO translations VALUES (?, ?)', rows)
+                    except sqlite3.Error:
+                        pass
+        finally:
+            if db is not None:
+                db.close()
+
+        return [self._cache.get(key) for key in keys]
+
+    def _translate_texts(self, texts: list, from_lang: str, to_lang: str) -> list:
+        """Translate cue texts a request-sized batch at a time, several batches at once.
+
+        Falls back to one request per cue for any batch whose reply does not
+        split back into the same number of texts.
+        """
+        batches = []
+        batch, size = [], 0
+        for text in texts:
+            if batch and size + len(_SEPARATOR) + len(text) > _MAX_REQUEST_CHARS:
+                batches.append(batch)
+                batch, size = [], 0
+            batch.append(text)
+            size += len(_SEPARATOR) + len(text)
+        if batch:
+            batches.append(batch)
+
+        def translate(text):
+            return _with_retry(self._translator(from_lang, to_lang).translate, text)
+
+        def translate_batch(batch):
+            parts = _SEPARATOR_SPLIT.split((translate(_SEPARATOR.join(batch)) or "").strip())
+            if len(parts) != len(batch):
+                parts = [translate(text) for text in batch]
+            return parts
+
+        return [part for parts in self._pool.map(translate_batch, batches) for part in parts]
+
+    @property
+    def supported_languages(self) -> list:
+        """Languages Google can translate between, shared by every instance."""
+        return list(_supported_languages())
 
     def get_supported_languages(self):
         """Returns the list of supported languages."""